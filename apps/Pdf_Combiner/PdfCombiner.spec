@@ -49,6 +49,7 @@ a = Analysis(
         'PyQt6',
         'PyPDF2',
         'fitz',  # PyMuPDF
+        'PIL.Image',  # Lossy compression and image slides
         'pdf2docx',
         'tabula',
         'jpype',  # Required for tabula
@@ -70,7 +71,6 @@ a = Analysis(
     excludes=[
         'scipy',
         'matplotlib',
-        'PIL',
         'tkinter',
         'pytest',
         'pygments',
@@ -99,7 +99,6 @@ a = Analysis(
         'charset_normalizer',
         'lz4',
         'xml.etree.cElementTree',
-        'PIL.ImageFilter',
         'PIL.SpiderImagePlugin',
         'xml.dom.domreg',
         'pdfminer',
@@ -116,7 +115,6 @@ a = Analysis(
         'pandas.io.formats.style',
         'pandas.io.clipboard',
         'sqlite3',
-        'multiprocessing.util',
         'difflib',
         'sysconfig',
         'platform',
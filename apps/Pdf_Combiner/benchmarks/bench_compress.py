@@ -0,0 +1,96 @@
+"""Report size reduction against time for each compression profile.
+
+Usage::
+
+    python benchmarks/bench_compress.py --pages 20 --dpi 300 --workers 1 4
+
+The corpus mimics a scan: every page is one full-page photo-like image at
+``--dpi``, alternating PNG and JPEG and colour and greyscale, with a logo
+repeated on every page. Peak RSS is that of the compressing process; pool
+workers are not included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import tempfile
+from pathlib import Path
+
+from common import format_row, run_isolated
+
+import fitz  # PyMuPDF
+
+from pdf_combiner.services import pdf_ops
+
+
+def _photo(seed: int, width: int, height: int, grey: bool) -> bytes:
+    from PIL import Image, ImageFilter
+
+    gradient = Image.radial_gradient("L").resize((width, height))
+    noise = (
+        Image.effect_noise((width // 4, height // 4), 40 + seed)
+        .resize((width, height))
+        .filter(ImageFilter.GaussianBlur(2))
+    )
+    image = Image.merge(
+        "RGB", (Image.blend(gradient, noise, 0.5), noise, gradient.transpose(Image.FLIP_LEFT_RIGHT))
+    )
+    if grey:
+        image = image.convert("L")
+    buffer = io.BytesIO()
+    if seed % 2:
+        image.save(buffer, "PNG")
+    else:
+        image.save(buffer, "JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def build_scan(path: Path, pages: int, dpi: int) -> Path:
+    width, height = round(8.27 * dpi), round(11.69 * dpi)  # A4
+    logo = _photo(0, dpi, dpi, grey=False)
+    with fitz.open() as doc:
+        for number in range(pages):
+            # Each page is built on its own, so every page carries its own copy
+            # of the logo, as a merge of separately scanned files would.
+            with fitz.open() as single:
+                page = single.new_page(width=595, height=842)
+                page.insert_image(page.rect, stream=_photo(number, width, height, grey=number % 3 == 0))
+                page.insert_image(fitz.Rect(36, 36, 108, 108), stream=logo)
+                page.insert_text((130, 80), f"Scanned page {number + 1}", fontsize=18)
+                doc.insert_pdf(single)
+        doc.save(path)
+    return path
+
+
+def _compress(pdf_path: Path, output_dir: Path, profile: str, workers: int) -> int:
+    output, _ = pdf_ops.compress_pdf(pdf_path, output_dir, profile=profile, workers=workers)
+    size = Path(output).stat().st_size
+    Path(output).unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--dpi", type=int, default=300, help="resolution of the scanned pages")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    widths = (12, 10, 12, 14, 12, 12)
+    with tempfile.TemporaryDirectory() as workdir:
+        root = Path(workdir)
+        source = build_scan(root / "scan.pdf", args.pages, args.dpi)
+        original = source.stat().st_size
+        print(f"input: {args.pages} pages at {args.dpi} DPI, {original / 2**20:.1f} MB\n")
+        print(format_row("profile", "workers", "seconds", "peak RSS MB", "output MB", "reduction %",
+                         widths=widths))
+        for profile in pdf_ops.COMPRESSION_PROFILES:
+            for workers in args.workers if profile != "lossless" else [1]:
+                seconds, peak, size = run_isolated(_compress, source, root / "out", profile, workers)
+                print(format_row(profile, workers, seconds, peak, size / 2**20,
+                                 (1 - size / original) * 100, widths=widths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare output size and time of merges with and without resource deduplication.
+
+Usage::
+
+    python benchmarks/bench_dedup.py --invoices 50 500
+
+The corpus mimics a batch of invoices produced by one system: every file is
+a separate one-page PDF embedding the same TrueType font and the same JPEG
+letterhead logo, tagged with an sRGB ICC profile, plus its own text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import tempfile
+from pathlib import Path
+
+from common import format_row, run_isolated
+
+import fitz  # PyMuPDF
+
+from pdf_combiner.services import pdf_ops
+
+
+def _logo() -> bytes:
+    from PIL import Image, ImageCms, ImageDraw
+
+    image = Image.radial_gradient("L").resize((600, 200)).convert("RGB")
+    ImageDraw.Draw(image).rectangle((40, 40, 560, 160), outline=(20, 60, 160), width=12)
+    profile = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90, icc_profile=profile)
+    return buffer.getvalue()
+
+
+def build_invoices(directory: Path, count: int) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    logo = _logo()
+    font = fitz.Font("tiro").buffer
+    paths: list[Path] = []
+    for number in range(count):
+        path = directory / f"invoice_{number:05d}.pdf"
+        with fitz.open() as doc:
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(36, 36, 216, 96), stream=logo)
+            page.insert_font(fontname="F1", fontbuffer=font)
+            page.insert_text((36, 140), f"Invoice {number + 1:05d}", fontname="F1", fontsize=20)
+            for line in range(12):
+                page.insert_text((36, 190 + line * 18),
+                                 f"Item {line + 1}: {(number * 7 + line) % 90 + 10}.00 EUR",
+                                 fontname="F1", fontsize=11)
+            doc.save(path, garbage=3, deflate=True)
+        paths.append(path)
+    return paths
+
+
+def _merge(paths: list[Path], output_dir: Path, streaming: bool, deduplicate: bool) -> int:
+    output = pdf_ops.merge_pdfs(paths, output_dir, prefix="bench", streaming=streaming,
+                                deduplicate=deduplicate)
+    size = Path(output).stat().st_size
+    Path(output).unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--invoices", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    widths = (18, 10, 12, 14, 12)
+    print(format_row("engine", "files", "seconds", "peak RSS MB", "output MB", widths=widths))
+    for count in args.invoices:
+        with tempfile.TemporaryDirectory() as workdir:
+            root = Path(workdir)
+            paths = build_invoices(root / "corpus", count)
+            for name, streaming, deduplicate in (("pypdf2 (memory)", False, False),
+                                                 ("pymupdf (stream)", True, False),
+                                                 ("pymupdf (dedupe)", False, True)):
+                seconds, peak, size = run_isolated(_merge, paths, root / "out", streaming,
+                                                   deduplicate)
+                print(format_row(name, count, seconds, peak, size / 2**20, widths=widths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Time page extraction of random selections from a large document.
+
+Usage::
+
+    python benchmarks/bench_extract.py --pages 10000 --select 1000 --sets 10
+
+The source is one document merged from the synthetic corpus, so each image
+is shared by a block of consecutive pages. "per-page copy" is the former
+``extract_pages`` loop, one ``insert_pdf`` call per page; the other rows use
+``pdf_ops``. The multi-output rows split the selection into ``--sets``
+random sets and write one file per set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from common import build_corpus, format_row, run_isolated
+
+import fitz  # PyMuPDF
+
+from pdf_combiner.services import pdf_ops
+
+
+def build_source(root: Path, pages: int) -> Path:
+    path = root / "source.pdf"
+    with fitz.open() as doc:
+        for part in build_corpus(root / "corpus", pages, pages_per_file=500):
+            with fitz.open(part) as source:
+                doc.insert_pdf(source)
+        doc.save(path, garbage=3, deflate=True)
+    return path
+
+
+def _per_page_copy(source_path: Path, page_sets: list[list[int]], output_dir: Path) -> int:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    size = 0
+    with fitz.open(source_path) as source:
+        for number, pages in enumerate(page_sets):
+            with fitz.open() as target:
+                for page in pages:
+                    target.insert_pdf(source, from_page=page - 1, to_page=page - 1)
+                output = output_dir / f"baseline_{number}.pdf"
+                target.save(output)
+            size += output.stat().st_size
+            output.unlink()
+    return size
+
+
+def _extract_each(source_path: Path, page_sets: list[list[int]], output_dir: Path) -> int:
+    size = 0
+    for pages in page_sets:
+        output = Path(pdf_ops.extract_pages(source_path, pages, output_dir))
+        size += output.stat().st_size
+        output.unlink()
+    return size
+
+
+def _extract_sets(source_path: Path, page_sets: list[list[int]], output_dir: Path) -> int:
+    size = 0
+    for output in map(Path, pdf_ops.extract_page_sets(source_path, page_sets, output_dir)):
+        size += output.stat().st_size
+        output.unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10000, help="pages in the source document")
+    parser.add_argument("--select", type=int, default=1000, help="random pages to extract")
+    parser.add_argument("--sets", type=int, default=10, help="output files for the multi-output rows")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    selection = rng.sample(range(1, args.pages + 1), args.select)
+    single = [sorted(selection)]
+    sets = [sorted(selection[number::args.sets]) for number in range(args.sets)]
+
+    widths = (28, 8, 12, 14, 12)
+    with tempfile.TemporaryDirectory() as workdir:
+        root = Path(workdir)
+        source = build_source(root, args.pages)
+        print(f"input: {args.pages} pages, {source.stat().st_size / 2**20:.1f} MB; "
+              f"{args.select} random pages, {len(pdf_ops._contiguous_runs(single[0]))} runs\n")
+        print(format_row("method", "files", "seconds", "peak RSS MB", "output MB", widths=widths))
+        for name, function, page_sets in (
+            ("per-page copy", _per_page_copy, single),
+            ("extract_pages", _extract_each, single),
+            ("per-page copy", _per_page_copy, sets),
+            ("extract_pages per set", _extract_each, sets),
+            ("extract_page_sets", _extract_sets, sets),
+        ):
+            seconds, peak, size = run_isolated(function, source, page_sets, root / "out")
+            print(format_row(name, len(page_sets), seconds, peak, size / 2**20, widths=widths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare peak memory and wall time of the merge engines in ``pdf_ops``.
+
+Usage::
+
+    python benchmarks/bench_merge.py --pages 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from common import build_corpus, format_row, run_isolated
+
+from pdf_combiner.services import pdf_ops
+
+
+def _merge(paths: list[Path], output_dir: Path, streaming: bool) -> int:
+    output = pdf_ops.merge_pdfs(paths, output_dir, prefix="bench", streaming=streaming)
+    size = Path(output).stat().st_size
+    Path(output).unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--pages-per-file", type=int, default=100)
+    args = parser.parse_args()
+
+    print(format_row("engine", "pages", "seconds", "peak RSS MB", widths=(18, 10, 12, 14)))
+    for total in args.pages:
+        with tempfile.TemporaryDirectory() as workdir:
+            root = Path(workdir)
+            paths = build_corpus(root / "corpus", total, args.pages_per_file)
+            for name, streaming in (("pypdf2 (memory)", False), ("pymupdf (stream)", True)):
+                seconds, peak, _ = run_isolated(_merge, paths, root / "out", streaming)
+                print(format_row(name, total, seconds, peak, widths=(18, 10, 12, 14)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time PowerPoint conversion per slide mode and worker count.
+
+Usage::
+
+    python benchmarks/bench_powerpoint.py --pages 300 --workers 1 4 --dpi 110
+
+Peak RSS is that of the converting process; pool workers are not included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from common import build_corpus, format_row, run_isolated
+
+from pdf_combiner.services import pdf_ops
+
+
+def _legacy_text_deck(pdf_path: Path, output_dir: Path) -> int:
+    """The previous conversion: one pdfplumber pass and a text box per page."""
+    import pdfplumber
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    output_path = output_dir / "legacy.pptx"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    presentation = Presentation()
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+            text_box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(5))
+            text_box.text_frame.text = page.extract_text() or ""
+    presentation.save(output_path)
+    size = output_path.stat().st_size
+    output_path.unlink()
+    return size
+
+
+def _convert(pdf_path: Path, output_dir: Path, slide_mode: str, workers: int, dpi: int) -> int:
+    output = pdf_ops.convert_pdf(
+        pdf_path, output_dir, "powerpoint", workers=workers, slide_mode=slide_mode, dpi=dpi
+    )
+    size = Path(output).stat().st_size
+    Path(output).unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--dpi", type=int, default=110)
+    args = parser.parse_args()
+
+    widths = (20, 10, 12, 14, 12)
+    with tempfile.TemporaryDirectory() as workdir:
+        root = Path(workdir)
+        source = build_corpus(root / "corpus", args.pages, pages_per_file=args.pages)[0]
+        print(format_row("mode", "workers", "seconds", "peak RSS MB", "deck MB", widths=widths))
+        seconds, peak, size = run_isolated(_legacy_text_deck, source, root / "out")
+        print(format_row("text (previous)", 1, seconds, peak, size / 2**20, widths=widths))
+        for slide_mode in pdf_ops.SLIDE_MODES:
+            for workers in args.workers:
+                seconds, peak, size = run_isolated(
+                    _convert, source, root / "out", slide_mode, workers, args.dpi
+                )
+                print(format_row(slide_mode, workers, seconds, peak, size / 2**20, widths=widths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Micro-benchmark the Pixmap to QImage conversion used by the preview.
+
+Usage::
+
+    python benchmarks/bench_preview.py --dpi 150 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from common import format_row
+
+import fitz  # PyMuPDF
+from PyQt6.QtGui import QImage
+
+from pdf_combiner.ui.preview import _to_qimage
+
+
+def _copying_to_qimage(pix: fitz.Pixmap) -> QImage:
+    """The previous conversion: wrap a bytes copy of the samples, then copy again."""
+    image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+    return image.copy()
+
+
+def _a4_pixmap(dpi: int) -> fitz.Pixmap:
+    with fitz.open() as document:
+        page = document.new_page(width=595, height=842)
+        page.insert_text((72, 72), "Preview benchmark", fontsize=24)
+        page.draw_rect(fitz.Rect(72, 120, 520, 760), color=(0, 0, 1), fill=(0.9, 0.9, 1))
+        return page.get_pixmap(dpi=dpi)
+
+
+def _time(function, pix: fitz.Pixmap, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        image = function(pix)
+        image.pixel(0, 0)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dpi", type=int, nargs="+", default=[150, 300])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(format_row("conversion", "dpi", "ms/frame", "frame MB", widths=(18, 8, 12, 12)))
+    for dpi in args.dpi:
+        pix = _a4_pixmap(dpi)
+        frame_mb = pix.stride * pix.height / (1024 * 1024)
+        for name, function in (("copying", _copying_to_qimage), ("zero-copy", _to_qimage)):
+            elapsed = _time(function, pix, args.repeat)
+            print(format_row(name, dpi, elapsed, frame_mb, widths=(18, 8, 12, 12)))
+
+
+if __name__ == "__main__":
+    main()
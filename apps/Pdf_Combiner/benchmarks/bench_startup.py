@@ -0,0 +1,77 @@
+"""Measure the cold import time of the GUI entry point and fail above a budget.
+
+Usage::
+
+    python benchmarks/bench_startup.py --budget-ms 800 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from common import format_row
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Converter backends that pdf_ops imports on first use; none may load at start-up.
+LAZY_MODULES = ("pandas", "tabula", "openpyxl", "pdf2docx", "pptx", "pdfplumber", "PyPDF2")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _import_profile(module: str) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return {name: (self us, cumulative us)}."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")])
+    ))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    profile: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            profile[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return profile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="pdf_combiner.main")
+    parser.add_argument("--budget-ms", type=float, default=800.0,
+                        help="fail if the best cold import takes longer than this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [_import_profile(args.module) for _ in range(args.repeat)]
+    # The fastest run is the least disturbed by other load on the machine.
+    best = min(runs, key=lambda profile: profile[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(format_row("module", "self ms", "cumulative ms", widths=(40, 12, 14)))
+    slowest = sorted(best.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(format_row(name, self_us / 1000, cumulative_us / 1000, widths=(40, 12, 14)))
+    print(f"\n{args.module}: {total_ms:.1f} ms (best of {args.repeat}), budget {args.budget_ms:.0f} ms")
+
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        raise SystemExit(f"converter backends imported at start-up: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        raise SystemExit(
+            f"cold start of {args.module} took {total_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Time text conversion per backend and worker count.
+
+Usage::
+
+    python benchmarks/bench_text.py --pages 300 --workers 1 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from common import build_corpus, format_row, run_isolated
+
+from pdf_combiner.services import pdf_ops
+
+
+def _convert(pdf_path: Path, output_dir: Path, backend: str, workers: int) -> int:
+    output = pdf_ops.convert_pdf(pdf_path, output_dir, "text", workers=workers, text_backend=backend)
+    size = Path(output).stat().st_size
+    Path(output).unlink()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--backends", nargs="+", choices=pdf_ops.TEXT_BACKENDS,
+                        default=list(pdf_ops.TEXT_BACKENDS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        root = Path(workdir)
+        corpus = build_corpus(root / "corpus", args.pages, pages_per_file=args.pages, with_images=False)
+        print(format_row("backend", "workers", "seconds", "pages/s", widths=(14, 10, 12, 12)))
+        for backend in args.backends:
+            for workers in args.workers:
+                seconds, _, _ = run_isolated(_convert, corpus[0], root / "out", backend, workers)
+                print(format_row(backend, workers, seconds, args.pages / seconds, widths=(14, 10, 12, 12)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Shared helpers for the PDF Toolkit benchmark scripts."""
+
+from __future__ import annotations
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import fitz  # PyMuPDF  # noqa: E402
+
+
+def build_corpus(directory: Path, total_pages: int, pages_per_file: int = 100,
+                 with_images: bool = True) -> list[Path]:
+    """Write synthetic PDFs holding ``total_pages`` pages split across several files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    remaining = total_pages
+    index = 0
+    while remaining > 0:
+        count = min(pages_per_file, remaining)
+        path = directory / f"input_{index:04d}.pdf"
+        with fitz.open() as doc:
+            image = _noise_png(index) if with_images else None
+            for number in range(count):
+                page = doc.new_page()
+                page.insert_text((72, 72), f"File {index} - page {number + 1}", fontsize=18)
+                page.insert_text((72, 110), "Lorem ipsum dolor sit amet " * 3, fontsize=9)
+                if image is not None:
+                    page.insert_image(fitz.Rect(72, 140, 520, 700), stream=image)
+            doc.save(path, garbage=3, deflate=True)
+        paths.append(path)
+        remaining -= count
+        index += 1
+    return paths
+
+
+def _noise_png(seed: int, width: int = 600, height: int = 800) -> bytes:
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, width, height), False)
+    pix.set_rect(pix.irect, ((seed * 37) % 256,))
+    pix.invert_irect(fitz.IRect(0, 0, width // 2, height // 3))
+    return pix.tobytes("png")
+
+
+def peak_rss_mb() -> float | None:
+    """Return the peak resident set size of the current process in megabytes."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _measure(function: Callable[..., Any], args: tuple) -> tuple[float, float | None, Any]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, peak_rss_mb(), result
+
+
+def run_isolated(function: Callable[..., Any], *args: Any) -> tuple[float, float | None, Any]:
+    """Run ``function`` in a fresh process and return (seconds, peak RSS MB, result)."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_measure, function, args).result()
+
+
+def format_row(*columns: Any, widths: tuple[int, ...] = (18, 12, 12, 14)) -> str:
+    cells = []
+    for column, width in zip(columns, widths):
+        if isinstance(column, float):
+            column = f"{column:.2f}"
+        elif column is None:
+            column = "n/a"
+        cells.append(str(column).ljust(width))
+    return "".join(cells).rstrip()
@@ -1,5 +1,13 @@
 """PDF Toolkit PyQt6 application."""
 
-from .main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name: str):
+    # Imported on first use so the headless CLI never loads PyQt6.
+    if name == "main":
+        from .main import main as gui_main
+
+        globals()["main"] = gui_main
+        return gui_main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,12 @@
-from .main import main
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Any arguments select the headless command line, which never loads PyQt6.
+        from .cli import main as cli_main
+
+        sys.exit(cli_main())
+
+    from .main import main
+
     main()
@@ -0,0 +1,397 @@
+"""Headless command line interface to :mod:`pdf_combiner.services.pdf_ops`.
+
+Run ``python -m pdf_combiner <command> --help`` for the options of a command.
+Single operations run in-process; ``batch`` reads a JSON or CSV manifest and
+runs its jobs in parallel on a process pool. Nothing here imports PyQt6.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from pdf_combiner.services import pdf_ops
+
+__all__ = ["main", "load_manifest", "run_batch", "run_job"]
+
+OPERATIONS = ("merge", "extract", "split", "rotate", "compress", "convert")
+
+# Manifest fields holding several values; CSV cells separate them with ";".
+_LIST_FIELDS = ("inputs", "ranges")
+_INT_FIELDS = ("rotation", "chunk_size", "workers", "flush_pages", "dpi")
+_BOOL_FIELDS = ("streaming", "deduplicate", "in_place")
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(";") if item.strip()]
+    return [str(item) for item in value]
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def _as_pages(value: Any) -> str:
+    """Read a page selection: a string such as ``"1,3,5-7"`` or a JSON list like ``[1, 3, "5-7"]``."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, list) and all(
+        isinstance(item, str) or (isinstance(item, int) and not isinstance(item, bool))
+        for item in value
+    ):
+        return ",".join(str(item) for item in value)
+    raise pdf_ops.PdfOperationError(
+        f'pages must be a string such as "1,3,5-7" or a list of page numbers and ranges, '
+        f"not {value!r}"
+    )
+
+
+def _page_sets(pages: str) -> List[List[int]]:
+    """Parse an extract selection; ``";"`` separates the page sets written to separate files."""
+    return [pdf_ops.parse_page_ranges(spec) for spec in pages.split(";") if spec.strip()]
+
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+
+def _as_size(value: Any) -> int:
+    """Read a byte count such as ``2500000``, ``"500KB"`` or ``"1.5 MB"``."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*", str(value), re.IGNORECASE)
+    if not match:
+        raise pdf_ops.PdfOperationError(f"Not a size: {value!r} (use e.g. 500KB or 2MB)")
+    number, unit = match.groups()
+    unit = unit.upper()
+    if unit and not unit.endswith("B"):
+        unit += "B"
+    return int(float(number) * _SIZE_UNITS[unit])
+
+
+def _normalise_job(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty values and coerce manifest strings to the types pdf_ops expects."""
+    job = {key.strip(): value for key, value in raw.items() if key and value not in (None, "")}
+    operation = str(job.get("operation", "")).strip().lower()
+    if operation not in OPERATIONS:
+        raise pdf_ops.PdfOperationError(f"Unknown operation: {job.get('operation')!r}")
+    job["operation"] = operation
+    for field in _LIST_FIELDS:
+        if field in job:
+            job[field] = _as_list(job[field])
+    for field in _INT_FIELDS:
+        if field in job:
+            try:
+                job[field] = int(job[field])
+            except (TypeError, ValueError) as exc:
+                raise pdf_ops.PdfOperationError(f"{field} must be a whole number") from exc
+    for field in _BOOL_FIELDS:
+        if field in job:
+            job[field] = _as_bool(job[field])
+    if "output_dir" not in job and not (operation == "rotate" and job.get("in_place")):
+        raise pdf_ops.PdfOperationError("Every job needs an output_dir")
+    if "target_size" in job:
+        job["target_size"] = _as_size(job["target_size"])
+    if "pages" in job:
+        job["pages"] = _as_pages(job["pages"])
+        if operation == "extract":
+            _page_sets(job["pages"])
+        else:
+            pdf_ops.parse_page_ranges(job["pages"])
+    if operation in ("merge", "compress"):
+        job.setdefault("inputs", _as_list(job.pop("input", None)))
+        if not job["inputs"]:
+            raise pdf_ops.PdfOperationError(f"{operation} needs inputs")
+    elif "input" not in job:
+        raise pdf_ops.PdfOperationError(f"{operation} needs an input")
+    if operation == "split" and "mode" not in job:
+        if job.get("ranges"):
+            job["mode"] = "ranges"
+        elif job.get("chunk_size", 1) > 1:
+            job["mode"] = "chunks"
+    return job
+
+
+def load_manifest(path: os.PathLike[str] | str) -> List[Dict[str, Any]]:
+    """Read jobs from a JSON list (or ``{"jobs": [...]}``) or a CSV file with a header row.
+
+    Each job names an ``operation`` and its ``output_dir`` (optional for an
+    ``in_place`` rotate); merge and compress take ``inputs``, the others a
+    single ``input``, plus the options of the matching ``pdf_ops``
+    function (``pages``, ``rotation``, ``in_place``, ``format``, ``text_backend``,
+    ``slide_mode``, ``dpi``, ``table_backend``, ``profile``, ``target_size``,
+    ``mode``, ``chunk_size``, ``ranges``, ``workers``, ``prefix``,
+    ``streaming``, ``flush_pages``, ``deduplicate``).
+    Relative paths are resolved against the manifest's folder.
+    """
+    manifest = Path(path)
+    try:
+        if manifest.suffix.lower() == ".csv":
+            with manifest.open(newline="", encoding="utf-8-sig") as handle:
+                rows: List[Dict[str, Any]] = list(csv.DictReader(handle))
+        else:
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+            rows = data.get("jobs", []) if isinstance(data, dict) else data
+    except (OSError, ValueError) as exc:
+        raise pdf_ops.PdfOperationError(f"Unable to read manifest {manifest}: {exc}") from exc
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise pdf_ops.PdfOperationError("Manifest must be a list of job objects")
+
+    base = manifest.resolve().parent
+    jobs = []
+    for number, row in enumerate(rows, start=1):
+        try:
+            job = _normalise_job(row)
+        except pdf_ops.PdfOperationError as exc:
+            raise pdf_ops.PdfOperationError(f"Job {number}: {exc}") from exc
+        if "input" in job:
+            job["input"] = str(base / job["input"])
+        if "inputs" in job:
+            job["inputs"] = [str(base / item) for item in job["inputs"]]
+        if "output_dir" in job:
+            job["output_dir"] = str(base / job["output_dir"])
+        jobs.append(job)
+    return jobs
+
+
+def run_job(job: Dict[str, Any]) -> str:
+    """Run one normalised job and return a short description of its output."""
+    operation = job["operation"]
+    output_dir = job.get("output_dir")
+    if operation == "merge":
+        return pdf_ops.merge_pdfs(
+            job["inputs"],
+            output_dir,
+            prefix=job.get("prefix", "merged_document"),
+            streaming=job.get("streaming", False),
+            flush_pages=job.get("flush_pages", 200),
+            deduplicate=job.get("deduplicate", False),
+        )
+    if operation == "extract":
+        page_sets = _page_sets(str(job.get("pages", "")))
+        return ", ".join(pdf_ops.extract_page_sets(job["input"], page_sets, output_dir))
+    if operation == "split":
+        return pdf_ops.split_pdf(
+            job["input"],
+            output_dir,
+            workers=job.get("workers", 1),
+            mode=job.get("mode", "pages"),
+            chunk_size=job.get("chunk_size", 1),
+            ranges=job.get("ranges"),
+        )
+    if operation == "rotate":
+        pages = pdf_ops.parse_page_ranges(str(job.get("pages", ""))) or None
+        return pdf_ops.rotate_pdf(
+            job["input"],
+            output_dir,
+            job.get("rotation", 90),
+            pages=pages,
+            in_place=job.get("in_place", False),
+        )
+    if operation == "compress":
+        results = pdf_ops.compress_pdfs(
+            job["inputs"],
+            output_dir,
+            profile=job.get("profile", "lossless"),
+            target_size=job.get("target_size"),
+            workers=job.get("workers", 1),
+        )
+        return ", ".join(f"{output_path} (saved {ratio:.1f}%)" for output_path, ratio in results)
+    return pdf_ops.convert_pdf(
+        job["input"],
+        output_dir,
+        job.get("format", "text"),
+        workers=job.get("workers", 1),
+        text_backend=job.get("text_backend", "pdfplumber"),
+        slide_mode=job.get("slide_mode", "text"),
+        dpi=job.get("dpi", 150),
+        table_backend=job.get("table_backend", "tabula"),
+    )
+
+
+def _timed_run(job: Dict[str, Any]) -> tuple[bool, str, float]:
+    # Runs in pool workers, so failures travel back as values rather than exceptions.
+    started = time.perf_counter()
+    try:
+        outcome = run_job(job)
+        ok = True
+    except Exception as exc:  # noqa: BLE001 - report every failure per job
+        outcome = str(exc)
+        ok = False
+    return ok, outcome, time.perf_counter() - started
+
+
+def _describe(job: Dict[str, Any]) -> str:
+    if "input" in job:
+        return f"{job['operation']} {Path(job['input']).name}"
+    if len(job["inputs"]) == 1:
+        return f"{job['operation']} {Path(job['inputs'][0]).name}"
+    return f"{job['operation']} {len(job['inputs'])} files"
+
+
+def run_batch(jobs: Sequence[Dict[str, Any]], workers: int,
+              report_path: os.PathLike[str] | str | None = None) -> int:
+    """Run ``jobs`` on a process pool, print one line per job and return the failure count."""
+    started = time.perf_counter()
+    results: List[Dict[str, Any] | None] = [None] * len(jobs)
+    width = len(str(len(jobs)))
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as executor:
+        futures = {executor.submit(_timed_run, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            ok, outcome, seconds = future.result()
+            results[index] = {
+                "job": index + 1,
+                "operation": jobs[index]["operation"],
+                "status": "ok" if ok else "failed",
+                "seconds": round(seconds, 3),
+                "output" if ok else "error": outcome,
+            }
+            status = "ok    " if ok else "FAILED"
+            print(
+                f"[{index + 1:>{width}}/{len(jobs)}] {status} {seconds:8.2f}s  "
+                f"{_describe(jobs[index])}: {outcome}",
+                flush=True,
+            )
+
+    failures = sum(1 for result in results if result and result["status"] != "ok")
+    elapsed = time.perf_counter() - started
+    print(f"{len(jobs) - failures} succeeded, {failures} failed in {elapsed:.2f}s")
+    if report_path:
+        Path(report_path).write_text(
+            json.dumps({"elapsed_seconds": round(elapsed, 3), "jobs": results}, indent=2),
+            encoding="utf-8",
+        )
+    return failures
+
+
+_MANIFEST_HELP = """\
+A JSON manifest is a list of job objects; a CSV manifest has one job per row.
+Every job has an "operation" and an "output_dir" (except an in_place rotate).
+merge and compress take "inputs", the other operations a single "input", plus
+options named like the command line flags (pages, rotation, in_place, format,
+text_backend, slide_mode, dpi, table_backend, profile, target_size, mode,
+chunk_size, ranges, workers, prefix, streaming, flush_pages, deduplicate). In
+CSV cells, separate several inputs or ranges with ";". In JSON, pages may also
+be a list of page numbers and ranges, e.g. [1, 3, "5-7"]. Relative paths are
+resolved against the manifest's folder.
+
+  [{"operation": "merge", "inputs": ["a.pdf", "b.pdf"], "output_dir": "out"},
+   {"operation": "convert", "input": "a.pdf", "format": "text", "output_dir": "out"}]
+"""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m pdf_combiner",
+        description="Run PDF Toolkit operations without the GUI.",
+    )
+    commands = parser.add_subparsers(dest="operation", required=True, metavar="command")
+
+    def add_command(name: str, help_text: str, multiple_inputs: bool = False,
+                    output_required: bool = True) -> argparse.ArgumentParser:
+        command = commands.add_parser(name, help=help_text, description=help_text)
+        if multiple_inputs:
+            command.add_argument("inputs", nargs="+", help="PDF files")
+        else:
+            command.add_argument("input", help="PDF file")
+        command.add_argument("-o", "--output-dir", dest="output_dir", required=output_required,
+                             help="folder for the output")
+        return command
+
+    merge = add_command("merge", "Merge several PDFs into one, in the order given.",
+                        multiple_inputs=True)
+    merge.add_argument("--prefix", default="merged_document")
+    merge.add_argument("--streaming", action="store_true",
+                       help="flush to disk periodically to bound memory use")
+    merge.add_argument("--flush-pages", dest="flush_pages", type=int, default=200)
+    merge.add_argument("--dedupe", dest="deduplicate", action="store_true",
+                       help="store fonts, images and ICC profiles shared by the inputs once")
+
+    extract = add_command("extract", "Copy selected pages into a new PDF, or into several.")
+    extract.add_argument("-p", "--pages", required=True,
+                         help='pages such as "1,3,5-7"; "1-3;8" writes one file per set')
+
+    split = add_command("split", "Split a PDF into several files.")
+    split.add_argument("--mode", choices=pdf_ops.SPLIT_MODES,
+                       help="default: ranges with --ranges, chunks with --chunk-size, else pages")
+    split.add_argument("--chunk-size", dest="chunk_size", type=int)
+    split.add_argument("--ranges", help='";"-separated page ranges, one output file each')
+    split.add_argument("--workers", type=int, default=1)
+
+    rotate = add_command("rotate", "Set the rotation of every page, or of selected pages.",
+                         output_required=False)
+    rotate.add_argument("-r", "--rotation", type=int, default=90)
+    rotate.add_argument("-p", "--pages", help='pages such as "1,3,5-7" (default: all)')
+    rotate.add_argument("--in-place", dest="in_place", action="store_true",
+                        help="append the change to the input file instead of writing a copy")
+
+    compress = add_command("compress", "Rewrite PDFs with compression and garbage collection.",
+                           multiple_inputs=True)
+    compress.add_argument("--profile", choices=pdf_ops.COMPRESSION_PROFILES, default="lossless",
+                          help="screen, ebook and print also downsample and recompress images")
+    compress.add_argument("--target-size", dest="target_size",
+                          help="instead of a profile, the best quality under this size per file "
+                               "(e.g. 2MB)")
+    compress.add_argument("--workers", type=int, default=1,
+                          help="files to compress at once, or image processes for one file")
+
+    convert = add_command("convert", "Convert a PDF to another format.")
+    convert.add_argument("-f", "--format", required=True,
+                         choices=("word", "excel", "powerpoint", "text"))
+    convert.add_argument("--text-backend", dest="text_backend", choices=pdf_ops.TEXT_BACKENDS,
+                         default="pdfplumber", help="pymupdf is much faster (text only)")
+    convert.add_argument("--slide-mode", dest="slide_mode", choices=pdf_ops.SLIDE_MODES,
+                         default="text", help="PowerPoint slides from page text or page images")
+    convert.add_argument("--dpi", type=int, default=150, help="resolution of image slides")
+    convert.add_argument("--table-backend", dest="table_backend", choices=pdf_ops.TABLE_BACKENDS,
+                         default="tabula", help="pymupdf and pdfplumber need no Java (excel only)")
+    convert.add_argument("--workers", type=int, default=1,
+                         help="processes to convert pages on (all but tabula's Excel)")
+
+    batch = commands.add_parser(
+        "batch",
+        help="Run every job in a JSON or CSV manifest.",
+        description="Run every job in a JSON or CSV manifest in parallel.",
+        epilog=_MANIFEST_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    batch.add_argument("manifest", help="manifest file (.json or .csv)")
+    batch.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                       help="jobs to run at once (default: CPU count)")
+    batch.add_argument("--report", help="also write per-job results and timings to this JSON file")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        if args.operation == "batch":
+            jobs = load_manifest(args.manifest)
+            if not jobs:
+                print("Manifest contains no jobs.")
+                return 0
+            return 1 if run_batch(jobs, args.workers, args.report) else 0
+        job = _normalise_job({key: value for key, value in vars(args).items() if value is not None})
+    except pdf_ops.PdfOperationError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    ok, outcome, seconds = _timed_run(job)
+    if not ok:
+        print(f"error: {outcome}", file=sys.stderr)
+        return 1
+    print(f"{outcome} ({seconds:.2f}s)")
+    return 0
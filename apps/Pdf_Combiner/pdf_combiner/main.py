@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -13,6 +14,7 @@ from pdf_combiner.ui.main_window import MainWindow
 
 
 def main() -> None:
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
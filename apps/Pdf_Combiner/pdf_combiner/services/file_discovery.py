@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from typing import Callable, Hashable, Iterable, List, Tuple
+
+__all__ = ["DiscoveredFile", "discover_pdfs", "file_identity"]
+
+# (path, file name, identity, size in bytes) — the row format of FileListModel.append_files.
+DiscoveredFile = Tuple[str, str, Hashable, int]
+
+
+def file_identity(path: str, stat: os.stat_result) -> Hashable:
+    """Return an identity that is shared by hard links and differently spelled paths."""
+    if stat.st_ino:
+        return (stat.st_dev, stat.st_ino)
+    # Some filesystems (FAT, many network shares) report no inode number.
+    return os.path.normcase(path)
+
+
+def _is_pdf_name(name: str) -> bool:
+    return name.lower().endswith(".pdf")
+
+
+def discover_pdfs(
+    paths: Iterable[str],
+    on_batch: Callable[[List[DiscoveredFile]], None],
+    batch_size: int = 500,
+    cancel_event: threading.Event | None = None,
+) -> Tuple[int, int]:
+    """Find PDFs among ``paths``, descending into directories recursively.
+
+    Discovered files are reported through ``on_batch`` in lists of up to
+    ``batch_size`` entries so a caller can show results while the walk is still
+    running. Directories are walked with :func:`os.scandir`, which reuses the
+    directory listing for type and size checks instead of stat-ing every file
+    again; directory symlinks are not followed, so link cycles cannot loop.
+    Files are selected by extension only; whether they really are PDFs is left
+    to whoever opens them.
+
+    The walk stops early once ``cancel_event`` is set. Returns the number of
+    PDFs found and the number of entries skipped (non-PDF files given
+    explicitly, or paths that could not be read).
+    """
+    found = 0
+    skipped = 0
+    batch: List[DiscoveredFile] = []
+
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    def emit(entry: DiscoveredFile) -> None:
+        nonlocal found
+        found += 1
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            on_batch(batch.copy())
+            batch.clear()
+
+    directories: List[str] = []
+    for raw_path in paths:
+        if cancelled():
+            break
+        if not raw_path:
+            skipped += 1
+            continue
+        try:
+            path = str(Path(raw_path).expanduser().resolve())
+            stat = os.stat(path)
+        except (OSError, RuntimeError):
+            skipped += 1
+            continue
+        if S_ISDIR(stat.st_mode):
+            directories.append(path)
+        elif S_ISREG(stat.st_mode) and _is_pdf_name(path):
+            emit((path, os.path.basename(path), file_identity(path, stat), stat.st_size))
+        else:
+            skipped += 1
+
+    # Depth-first with an explicit stack; each directory's entries are sorted so
+    # files arrive in a stable, readable order.
+    stack = list(reversed(directories))
+    while stack and not cancelled():
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name.lower())
+        except OSError:
+            skipped += 1
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            if cancelled():
+                break
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif _is_pdf_name(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    if not stat.st_ino:
+                        # DirEntry.stat() on Windows leaves st_ino at 0; os.stat fills it
+                        # in, so walked files get the same identity as explicit ones.
+                        stat = os.stat(entry.path)
+                    emit((entry.path, entry.name, file_identity(entry.path, stat), stat.st_size))
+            except OSError:
+                skipped += 1
+        stack.extend(reversed(subdirectories))
+
+    if batch:
+        on_batch(batch.copy())
+    return found, skipped
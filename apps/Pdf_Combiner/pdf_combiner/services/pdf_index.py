@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Iterable, Tuple
+
+import fitz  # PyMuPDF
+
+from pdf_combiner.services.pdf_ops import PdfOperationError
+
+__all__ = ["PdfMetadata", "PdfMetadataIndex", "file_digest", "read_pdf_metadata"]
+
+_DIGEST_SAMPLE_BYTES = 256 * 1024
+
+
+@dataclass(frozen=True)
+class PdfMetadata:
+    """Facts about a PDF that stay valid while its mtime and size are unchanged.
+
+    ``digest`` is computed on first access, so indexing a folder reads no more
+    of each file than parsing it needs.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    page_count: int
+    page_sizes: Tuple[Tuple[float, float], ...]
+    encrypted: bool
+    outline: Tuple[Tuple[int, str, int], ...]
+
+    @cached_property
+    def digest(self) -> str | None:
+        """Content key for the disk caches, or ``None`` if the file can no longer be read."""
+        try:
+            return file_digest(self.path)
+        except OSError:
+            return None
+
+
+def file_digest(pdf_path: os.PathLike[str] | str) -> str:
+    """Return a content digest of the file that is cheap even for very large PDFs.
+
+    The size and modification time plus samples from the start, middle and end
+    of the file are hashed, which identifies the same document across renames
+    and sessions without reading hundreds of megabytes. The mtime catches edits
+    that keep the size and fall outside the sampled windows.
+    """
+    path = Path(pdf_path)
+    stat = path.stat()
+    size = stat.st_size
+    hasher = hashlib.blake2b(f"{size}:{stat.st_mtime_ns}".encode("ascii"), digest_size=16)
+    with path.open("rb") as handle:
+        if size <= 3 * _DIGEST_SAMPLE_BYTES:
+            hasher.update(handle.read())
+        else:
+            for offset in (0, (size - _DIGEST_SAMPLE_BYTES) // 2, size - _DIGEST_SAMPLE_BYTES):
+                handle.seek(offset)
+                hasher.update(handle.read(_DIGEST_SAMPLE_BYTES))
+    return hasher.hexdigest()
+
+
+def read_pdf_metadata(pdf_path: os.PathLike[str] | str) -> PdfMetadata:
+    """Parse the PDF once and return its page count, page sizes, encryption and outline."""
+    path = Path(pdf_path)
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        raise PdfOperationError(f"PDF not found: {path}") from exc
+
+    try:
+        with fitz.open(path) as document:
+            encrypted = bool(document.needs_pass)
+            page_count = document.page_count
+            if encrypted:
+                page_sizes: Tuple[Tuple[float, float], ...] = ()
+                outline: Tuple[Tuple[int, str, int], ...] = ()
+            else:
+                page_sizes = tuple(
+                    (rect.width, rect.height)
+                    for rect in (document.page_cropbox(index) for index in range(page_count))
+                )
+                outline = tuple(
+                    (level, title, page) for level, title, page in document.get_toc(simple=True)
+                )
+    except Exception as exc:
+        raise PdfOperationError(f"Unable to read PDF: {path}") from exc
+
+    return PdfMetadata(
+        path=str(path),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        page_count=page_count,
+        page_sizes=page_sizes,
+        encrypted=encrypted,
+        outline=outline,
+    )
+
+
+class PdfMetadataIndex:
+    """Thread-safe cache of :class:`PdfMetadata` keyed by (path, mtime, size).
+
+    Lookups only ``stat`` the file; the document is parsed again only when it
+    changed on disk since it was indexed.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, PdfMetadata] = {}
+        self._lock = threading.Lock()
+
+    def get(self, pdf_path: os.PathLike[str] | str) -> PdfMetadata:
+        key = str(pdf_path)
+        try:
+            stat = os.stat(key)
+        except OSError as exc:
+            self.discard(key)
+            raise PdfOperationError(f"PDF not found: {key}") from exc
+
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        metadata = read_pdf_metadata(key)
+        with self._lock:
+            self._entries[key] = metadata
+        return metadata
+
+    def peek(self, pdf_path: os.PathLike[str] | str) -> PdfMetadata | None:
+        """Return the cached entry without touching the filesystem."""
+        with self._lock:
+            return self._entries.get(str(pdf_path))
+
+    def warm(self, pdf_paths: Iterable[os.PathLike[str] | str]) -> list[str]:
+        """Index every path, returning the ones that were indexed successfully."""
+        indexed: list[str] = []
+        for pdf_path in pdf_paths:
+            try:
+                self.get(pdf_path)
+            except PdfOperationError:
+                continue
+            indexed.append(str(pdf_path))
+        return indexed
+
+    def discard(self, pdf_path: os.PathLike[str] | str) -> None:
+        with self._lock:
+            self._entries.pop(str(pdf_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,43 +1,175 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import io
+import math
+import multiprocessing
 import os
+import re
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import closing
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
 
 import fitz  # PyMuPDF
-import pandas as pd
-import pdfplumber
-import PyPDF2
-import tabula
-from pdf2docx import Converter
-from pptx import Presentation
-from pptx.util import Inches
-from tabula.errors import JavaNotFoundError
+
+# PyPDF2 and the converter backends (pdf2docx, tabula/pandas, openpyxl,
+# python-pptx, pdfplumber) take most of a second to import, so each is imported
+# inside the function that needs it rather than at start-up.
 
 __all__ = [
     "PdfOperationError",
+    "OperationCancelled",
+    "ProgressCallback",
     "parse_page_ranges",
     "merge_pdfs",
     "extract_pages",
+    "extract_page_sets",
     "split_pdf",
+    "SPLIT_MODES",
     "rotate_pdf",
     "compress_pdf",
+    "compress_pdfs",
+    "COMPRESSION_PROFILES",
     "convert_pdf",
+    "TEXT_BACKENDS",
+    "SLIDE_MODES",
+    "TABLE_BACKENDS",
     "get_pdf_page_count",
 ]
 
+SPLIT_MODES = ("pages", "chunks", "ranges", "bookmarks")
+_SPLIT_FOLDER_SUFFIXES = {"pages": "pages", "chunks": "chunks", "ranges": "ranges",
+                          "bookmarks": "sections"}
+
+TEXT_BACKENDS = ("pdfplumber", "pymupdf")
+SLIDE_MODES = ("text", "image")
+TABLE_BACKENDS = ("tabula", "pymupdf", "pdfplumber")
+
+COMPRESSION_PROFILES = ("lossless", "screen", "ebook", "print")
+# Target DPI and JPEG quality per lossy profile, after Ghostscript's presets.
+_PROFILE_SETTINGS = {"screen": (72, 50), "ebook": (150, 70), "print": (300, 85)}
+# Images are only resampled when they exceed the target DPI by this factor.
+_DOWNSAMPLE_THRESHOLD = 1.5
+# (target DPI, JPEG quality) tried, best first, when compressing to a size budget.
+_TARGET_SIZE_STEPS = (
+    (300, 85), (225, 80), (150, 75), (120, 65), (96, 55), (72, 45), (50, 35),
+)
+
+_JAVA_MISSING_MESSAGE = (
+    "Java is required for Excel conversion but was not found. "
+    "Install Java and ensure it is on your PATH."
+)
+
+# Below this many pages per worker, process start-up costs more than it saves.
+_MIN_PAGES_PER_SPLIT_WORKER = 50
+# Extracting or rendering a page costs far more than copying it, so pooled
+# conversions pay off sooner; chunks stay small enough to keep memory bounded.
+_MIN_PAGES_PER_CONVERT_WORKER = 8
+_MAX_CONVERT_CHUNK_PAGES = 32
+# A resampled scan takes tenths of a second to encode, so a few are worth a process.
+_MIN_IMAGES_PER_COMPRESS_WORKER = 4
+
 
 class PdfOperationError(Exception):
     """Raised when a PDF operation fails."""
 
 
+class OperationCancelled(PdfOperationError):
+    """Raised when an operation stops because its ``cancel_event`` was set."""
+
+
+# Called with (units done, total units); the unit is pages unless stated otherwise.
+ProgressCallback = Callable[[int, int], None]
+
+
+class _ProgressTracker:
+    """Reports progress to an optional callback and polls an optional cancel event."""
+
+    def __init__(self, total: int, progress: ProgressCallback | None,
+                 cancel_event: threading.Event | None) -> None:
+        self.total = total
+        self.done = 0
+        self.progress = progress
+        self.cancel_event = cancel_event
+
+    def check(self) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise OperationCancelled("Operation cancelled")
+
+    def advance(self, count: int = 1) -> None:
+        self.check()
+        self.done += count
+        if self.progress is not None:
+            self.progress(self.done, self.total)
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return a pool of ``workers`` processes started as fresh interpreters.
+
+    The GUI creates pools from its worker threads, and forking a process that
+    runs other threads (Qt's among them) can leave a child stuck on a lock
+    one of them held. Spawning also matches the frozen builds on every platform.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
 def _ensure_output_dir(path: os.PathLike[str] | str) -> Path:
     directory = Path(path)
     directory.mkdir(parents=True, exist_ok=True)
     return directory
 
 
+def _create_unique_file(directory: Path, stem: str, suffix: str = ".pdf") -> Path:
+    """Create an empty ``stem + suffix`` in ``directory`` and return its path.
+
+    The file is created exclusively, so jobs running at the same time (a batch
+    manifest, the GUI job queue) never share an output: when the name is
+    taken, ``_2``, ``_3``, ... is appended to the stem.
+    """
+    number = 1
+    while True:
+        path = directory / (f"{stem}{suffix}" if number == 1 else f"{stem}_{number}{suffix}")
+        try:
+            with path.open("xb"):
+                return path
+        except FileExistsError:
+            number += 1
+
+
+def _contiguous_runs(pages: Sequence[int]) -> List[tuple[int, int]]:
+    """Collapse sorted 1-based page numbers into 0-based inclusive ``(first, last)`` runs."""
+    runs: List[tuple[int, int]] = []
+    for page in pages:
+        index = page - 1
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
+def _insert_runs(target: fitz.Document, source: fitz.Document,
+                 runs: Sequence[tuple[int, int]], tracker: _ProgressTracker | None = None) -> None:
+    """Append each 0-based ``(first, last)`` run of ``source`` to ``target``.
+
+    Every run is one ``insert_pdf`` call, and PyMuPDF's graft map is kept until
+    the last one, so fonts and images shared by several runs are copied once.
+    """
+    for number, (first, last) in enumerate(runs, start=1):
+        target.insert_pdf(source, from_page=first, to_page=last, final=number == len(runs))
+        if tracker is not None:
+            tracker.advance(last - first + 1)
+
+
+def _pages_label(first: int, last: int) -> str:
+    return f"page_{first}" if first == last else f"pages_{first}-{last}"
+
+
 def parse_page_ranges(range_string: str) -> List[int]:
     """Parse strings like "1,3,5-7" into a sorted list of unique page numbers."""
     if not range_string.strip():
@@ -79,12 +211,183 @@ def get_pdf_page_count(pdf_path: os.PathLike[str] | str) -> int:
         raise PdfOperationError(f"Unable to read PDF: {pdf_path}") from exc
 
 
+_REFERENCE = re.compile(r"\b(\d+) 0 R\b")
+_FONT_STREAM_KEYS = {
+    "/FontDescriptor": ("FontFile", "FontFile2", "FontFile3"),
+    "/Font": ("ToUnicode",),
+}
+
+
+def _resource_streams(document: fitz.Document, xrefs: range) -> List[int]:
+    """Return the ICC profile, font and image streams among ``xrefs``, in that order.
+
+    Profiles come before the images whose colour spaces use them, so an
+    image's digest can count on its profile already having been merged.
+    """
+    profiles: List[int] = []
+    fonts: List[int] = []
+    images: List[int] = []
+    for xref in xrefs:
+        if not document.xref_is_stream(xref):
+            for key in _FONT_STREAM_KEYS.get(document.xref_get_key(xref, "Type")[1], ()):
+                kind, value = document.xref_get_key(xref, key)
+                if kind == "xref" and int(value.split()[0]) in xrefs:
+                    fonts.append(int(value.split()[0]))
+        elif document.xref_get_key(xref, "Subtype")[1] == "/Image":
+            images.append(xref)
+        elif (document.xref_get_key(xref, "N")[0] == "int"
+                and document.xref_get_key(xref, "Subtype")[0] == "null"):
+            profiles.append(xref)
+    return profiles + list(dict.fromkeys(fonts)) + images
+
+
+def _object_digest(document: fitz.Document, xref: int, memo: dict[int, bytes],
+                   active: set[int]) -> bytes:
+    """Hash an object's definition, its stream and, recursively, everything it references.
+
+    Two objects with equal digests render identically wherever they are used,
+    even though the objects they point to have different numbers.
+    """
+    if xref in memo:
+        return memo[xref]
+    if xref in active:
+        return f"cycle {xref}".encode()  # Never equal to anything else.
+    active.add(xref)
+    definition = _REFERENCE.sub(
+        lambda match: _object_digest(document, int(match.group(1)), memo, active).hex(),
+        document.xref_object(xref, compressed=True),
+    )
+    digest = hashlib.sha1(definition.encode())
+    if document.xref_is_stream(xref):
+        digest.update(document.xref_stream_raw(xref))
+    active.discard(xref)
+    memo[xref] = digest.digest()
+    return memo[xref]
+
+
+def _merge_duplicate_streams(document: fitz.Document, first_xref: int,
+                             known: dict[bytes, int]) -> int:
+    """Drop resource streams added from ``first_xref`` on that repeat an earlier one.
+
+    ``known`` maps the digest of every resource stream kept so far to its
+    xref; it carries over between chunks because earlier xrefs stay valid
+    across incremental saves. References in the new objects are pointed at
+    the kept copy, then the duplicates are deleted. Returns how many were.
+    """
+    new_xrefs = range(first_xref, document.xref_length())
+    memo: dict[int, bytes] = {}
+    replacements: dict[int, int] = {}
+    for xref in _resource_streams(document, new_xrefs):
+        kept = known.setdefault(_object_digest(document, xref, memo, set()), xref)
+        if kept != xref:
+            replacements[xref] = kept
+    if not replacements:
+        return 0
+
+    def redirect(text: str) -> str:
+        return _REFERENCE.sub(
+            lambda match: f"{replacements.get(int(match.group(1)), int(match.group(1)))} 0 R",
+            text,
+        )
+
+    for xref in new_xrefs:
+        if xref in replacements:
+            continue
+        if document.xref_is_stream(xref):
+            # Rewriting a stream object's whole definition would drop its data.
+            for key in document.xref_get_keys(xref):
+                kind, value = document.xref_get_key(xref, key)
+                if kind in ("xref", "array", "dict") and _REFERENCE.search(value):
+                    document.xref_set_key(xref, key, redirect(value))
+        else:
+            definition = document.xref_object(xref, compressed=True)
+            if _REFERENCE.search(definition):
+                updated = redirect(definition)
+                if updated != definition:
+                    document.update_object(xref, updated)
+    for xref in replacements:
+        # Nothing refers to the copy any more; drop its data and leave a null
+        # object, which costs a few bytes in the output.
+        document.update_stream(xref, b"")
+        document.update_object(xref, "null")
+    return len(replacements)
+
+
+def _stream_merge(paths: Sequence[Path], output_path: Path, flush_pages: int,
+                  tracker: _ProgressTracker, deduplicate: bool = False,
+                  count_pages: bool = False) -> None:
+    """Append every page of ``paths`` to ``output_path`` in bounded-size chunks.
+
+    Pages are inserted into a PyMuPDF document that is flushed to disk (a full
+    save the first time, incremental saves afterwards) and reopened every
+    ``flush_pages`` pages, so only one chunk of copied objects lives in memory.
+    With ``deduplicate``, each chunk's font, image and ICC profile streams that
+    repeat one already written are replaced by references to it. With
+    ``count_pages`` each input's pages are added to the tracker's total as the
+    input is opened.
+    """
+    target = fitz.open()
+    written = False
+    pending = 0
+    known_streams: dict[bytes, int] = {}
+    try:
+        for path in paths:
+            with fitz.open(path) as source:
+                if count_pages:
+                    tracker.total += len(source)
+                for start in range(0, len(source), flush_pages):
+                    stop = min(start + flush_pages, len(source)) - 1
+                    first_xref = target.xref_length()
+                    target.insert_pdf(source, from_page=start, to_page=stop)
+                    if deduplicate:
+                        _merge_duplicate_streams(target, first_xref, known_streams)
+                    pending += stop - start + 1
+                    tracker.advance(stop - start + 1)
+                    if pending >= flush_pages:
+                        target = _flush_merge_chunk(target, output_path, written)
+                        written = True
+                        pending = 0
+        if pending or not written:
+            target = _flush_merge_chunk(target, output_path, written)
+    finally:
+        if not target.is_closed:
+            target.close()
+
+
+def _flush_merge_chunk(target: fitz.Document, output_path: Path, written: bool) -> fitz.Document:
+    if written:
+        target.saveIncr()
+    else:
+        target.save(output_path)
+    target.close()
+    return fitz.open(output_path)
+
+
 def merge_pdfs(pdf_paths: Sequence[os.PathLike[str] | str], output_dir: os.PathLike[str] | str,
-               prefix: str = "merged_document") -> str:
-    """Merge the given PDFs into a single document and return the output filepath."""
+               prefix: str = "merged_document", streaming: bool = False,
+               flush_pages: int = 200, progress: ProgressCallback | None = None,
+               cancel_event: threading.Event | None = None, deduplicate: bool = False,
+               page_counts: Sequence[int] | None = None) -> str:
+    """Merge the given PDFs into a single document and return the output filepath.
+
+    By default all pages are collected in one in-memory ``PyPDF2.PdfWriter``. With
+    ``streaming`` enabled the output is written with PyMuPDF and flushed to disk
+    every ``flush_pages`` pages, keeping memory bounded regardless of input size.
+    ``deduplicate`` stores fonts, images and ICC profiles that several inputs
+    embed identically (a letterhead logo, a corporate font) only once; it
+    implies ``streaming``, and duplicates are found across chunks as well.
+
+    ``progress`` is called with pages merged so far. Its total is the sum of
+    ``page_counts`` when the caller already knows them (the GUI's metadata
+    index), and otherwise grows as each input is opened, so no file is parsed
+    twice. Setting ``cancel_event`` stops the merge with
+    :class:`OperationCancelled` and removes the output.
+    """
     paths = [Path(p) for p in pdf_paths if p]
     if not paths:
         raise PdfOperationError("No PDF files provided for merge")
+    if flush_pages < 1:
+        raise PdfOperationError("flush_pages must be at least 1")
 
     for path in paths:
         if not path.exists():
@@ -92,17 +395,31 @@ def merge_pdfs(pdf_paths: Sequence[os.PathLike[str] | str], output_dir: os.PathL
 
     output_directory = _ensure_output_dir(output_dir)
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_directory / f"{prefix}_{timestamp}.pdf"
+    output_path = _create_unique_file(output_directory, f"{prefix}_{timestamp}")
 
-    writer = PyPDF2.PdfWriter()
+    count_pages = page_counts is None
+    tracker = _ProgressTracker(0 if count_pages else sum(page_counts), progress, cancel_event)
     try:
-        for path in paths:
-            with path.open("rb") as handle:
-                reader = PyPDF2.PdfReader(handle)
-                for page in reader.pages:
-                    writer.add_page(page)
-        with output_path.open("wb") as target:
-            writer.write(target)
+        if streaming or deduplicate:
+            _stream_merge(paths, output_path, flush_pages, tracker, deduplicate, count_pages)
+        else:
+            import PyPDF2
+
+            writer = PyPDF2.PdfWriter()
+            for path in paths:
+                with path.open("rb") as handle:
+                    reader = PyPDF2.PdfReader(handle)
+                    if count_pages:
+                        tracker.total += len(reader.pages)
+                    for page in reader.pages:
+                        writer.add_page(page)
+                        tracker.advance()
+            tracker.check()
+            with output_path.open("wb") as target:
+                writer.write(target)
+    except PdfOperationError:
+        output_path.unlink(missing_ok=True)
+        raise
     except Exception as exc:
         if output_path.exists():
             output_path.unlink(missing_ok=True)
@@ -112,70 +429,283 @@ def merge_pdfs(pdf_paths: Sequence[os.PathLike[str] | str], output_dir: os.PathL
 
 
 def extract_pages(pdf_path: os.PathLike[str] | str, pages: Iterable[int],
-                  output_dir: os.PathLike[str] | str) -> str:
-    """Extract specific pages to a new PDF and return the output filepath."""
+                  output_dir: os.PathLike[str] | str, progress: ProgressCallback | None = None,
+                  cancel_event: threading.Event | None = None) -> str:
+    """Extract specific pages to a new PDF and return the output filepath.
+
+    ``progress`` and ``cancel_event`` behave as for :func:`merge_pdfs`.
+    """
+    return extract_page_sets(pdf_path, [pages], output_dir, progress, cancel_event)[0]
+
+
+def extract_page_sets(pdf_path: os.PathLike[str] | str, page_sets: Sequence[Iterable[int]],
+                      output_dir: os.PathLike[str] | str,
+                      progress: ProgressCallback | None = None,
+                      cancel_event: threading.Event | None = None) -> List[str]:
+    """Extract each set of pages to its own PDF and return the output filepaths.
+
+    The source is opened once for all sets. Each set is written in page order
+    as ``extracted_<pages>.pdf``, numbered ``extracted_<n>_<pages>.pdf`` when
+    there are several sets. ``progress`` counts pages copied; when
+    ``cancel_event`` is set the files written so far are removed.
+    """
     pdf_path = Path(pdf_path)
-    page_indices = sorted({int(p) for p in pages})
-    if not page_indices:
+    selections = [sorted({int(p) for p in pages}) for pages in page_sets]
+    if not selections or not all(selections):
         raise PdfOperationError("No pages to extract")
 
     if not pdf_path.exists():
         raise PdfOperationError(f"PDF not found: {pdf_path}")
 
     output_directory = _ensure_output_dir(output_dir)
-    if len(page_indices) == 1:
-        suffix = f"page_{page_indices[0]}"
-    else:
-        suffix = f"pages_{page_indices[0]}-{page_indices[-1]}"
-
-    output_path = output_directory / f"extracted_{suffix}.pdf"
+    output_paths = []
+    for number, pages in enumerate(selections, start=1):
+        label = _pages_label(pages[0], pages[-1])
+        name = f"extracted_{label}.pdf" if len(selections) == 1 else f"extracted_{number}_{label}.pdf"
+        output_paths.append(output_directory / name)
 
+    written: List[Path] = []
     try:
         with fitz.open(pdf_path) as source:
             page_count = len(source)
-            for page in page_indices:
-                if page < 1 or page > page_count:
-                    raise PdfOperationError(
-                        f"Page {page} out of range. Document has {page_count} pages."
-                    )
-            with fitz.open() as target:
-                for page in page_indices:
-                    target.insert_pdf(source, from_page=page - 1, to_page=page - 1)
-                target.save(output_path)
+            for pages in selections:
+                for page in (pages[0], pages[-1]):
+                    if page < 1 or page > page_count:
+                        raise PdfOperationError(
+                            f"Page {page} out of range. Document has {page_count} pages."
+                        )
+            tracker = _ProgressTracker(sum(map(len, selections)), progress, cancel_event)
+            for pages, output_path in zip(selections, output_paths):
+                with fitz.open() as target:
+                    _insert_runs(target, source, _contiguous_runs(pages), tracker)
+                    written.append(output_path)
+                    target.save(output_path)
     except PdfOperationError:
+        for output_path in written:
+            output_path.unlink(missing_ok=True)
         raise
     except Exception as exc:
-        if output_path.exists():
+        for output_path in written:
             output_path.unlink(missing_ok=True)
         raise PdfOperationError(f"Failed to extract pages: {exc}") from exc
 
-    return str(output_path)
+    return [str(output_path) for output_path in output_paths]
+
+
+def _safe_filename(text: str, fallback: str) -> str:
+    cleaned = re.sub(r"[^\w\- ]+", "_", text).strip(" _")[:60]
+    return cleaned or fallback
+
+
+def _plan_split(source: fitz.Document, mode: str, chunk_size: int,
+                ranges: Sequence[str] | None) -> List[tuple[str, List[tuple[int, int]]]]:
+    """Return ``(filename, runs)`` output parts for the requested split strategy."""
+    page_count = len(source)
+    if mode == "pages":
+        return [
+            (f"page_{index + 1}.pdf", [(index, index)])
+            for index in range(page_count)
+        ]
+
+    if mode == "chunks":
+        if chunk_size < 1:
+            raise PdfOperationError("Chunk size must be at least 1")
+        return [
+            (
+                f"{_pages_label(start + 1, min(start + chunk_size, page_count))}.pdf",
+                [(start, min(start + chunk_size, page_count) - 1)],
+            )
+            for start in range(0, page_count, chunk_size)
+        ]
+
+    if mode == "ranges":
+        specs = [spec for spec in (ranges or []) if spec.strip()]
+        if not specs:
+            raise PdfOperationError("No page ranges provided for split")
+        parts = []
+        for number, spec in enumerate(specs, start=1):
+            pages = parse_page_ranges(spec)
+            if not pages:
+                raise PdfOperationError(f"Invalid range: {spec}")
+            for page in pages:
+                if page < 1 or page > page_count:
+                    raise PdfOperationError(
+                        f"Page {page} out of range. Document has {page_count} pages."
+                    )
+            label = _pages_label(pages[0], pages[-1])
+            parts.append((f"range_{number}_{label}.pdf", _contiguous_runs(pages)))
+        return parts
+
+    if mode == "bookmarks":
+        starts = []
+        for level, title, page in source.get_toc(simple=True):
+            if level == 1 and 1 <= page <= page_count:
+                starts.append((page - 1, title))
+        if not starts:
+            raise PdfOperationError("PDF has no top-level bookmarks to split by")
+        starts.sort(key=lambda entry: entry[0])
+        if starts[0][0] > 0:
+            starts.insert(0, (0, "Front matter"))
+        parts = []
+        width = len(str(len(starts)))
+        for number, (first, title) in enumerate(starts, start=1):
+            last = starts[number][0] - 1 if number < len(starts) else page_count - 1
+            if last < first:
+                continue
+            name = _safe_filename(title, f"section_{number}")
+            parts.append((f"{number:0{width}d}_{name}.pdf", [(first, last)]))
+        return parts
+
+    raise PdfOperationError(f"Unsupported split mode: {mode}")
+
+
+def _shard_parts(parts: Sequence[tuple[str, List[tuple[int, int]]]],
+                 workers: int) -> List[List[tuple[str, List[tuple[int, int]]]]]:
+    """Cut ``parts`` into at most ``workers`` contiguous shards of similar page totals."""
+    sizes = [sum(last - first + 1 for first, last in runs) for _, runs in parts]
+    budget = sum(sizes) / workers
+    shards: List[List[tuple[str, List[tuple[int, int]]]]] = [[]]
+    filled = 0
+    for part, size in zip(parts, sizes):
+        if shards[-1] and filled >= budget and len(shards) < workers:
+            shards.append([])
+            filled = 0
+        shards[-1].append(part)
+        filled += size
+    return shards
+
+
+def _part_pages(runs: Sequence[tuple[int, int]]) -> int:
+    return sum(last - first + 1 for first, last in runs)
 
 
-def split_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str) -> str:
-    """Split the PDF into individual pages and return the output directory."""
+def _write_split_parts(pdf_path: str, output_directory: str,
+                       parts: Sequence[tuple[str, Sequence[tuple[int, int]]]],
+                       tracker: _ProgressTracker | None = None) -> int:
+    """Write each ``(filename, runs)`` part of the source to its own PDF.
+
+    Every contiguous run of pages is copied with a single ``insert_pdf`` call.
+    Parts are saved under their :func:`_partial_name` until the whole split
+    has finished.
+    """
+    directory = Path(output_directory)
+    with fitz.open(pdf_path) as source:
+        for filename, runs in parts:
+            with fitz.open() as target:
+                _insert_runs(target, source, runs, tracker)
+                target.save(directory / _partial_name(filename))
+    return len(parts)
+
+
+def _partial_name(filename: str) -> str:
+    return f".{filename}.part"
+
+
+def _run_split_shards(pdf_path: str, output_directory: str,
+                      parts: Sequence[tuple[str, List[tuple[int, int]]]], workers: int,
+                      tracker: _ProgressTracker) -> None:
+    # Several shards per worker keep progress and cancellation reasonably fine
+    # grained; a shard that is already running always finishes.
+    shards = _shard_parts(parts, workers * 4)
+    with _process_pool(workers) as executor:
+        pending = {
+            executor.submit(_write_split_parts, pdf_path, output_directory, shard):
+                sum(_part_pages(runs) for _, runs in shard)
+            for shard in shards
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                tracker.check()
+                for future in done:
+                    future.result()
+                    tracker.advance(pending.pop(future))
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def split_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str,
+              workers: int = 1, mode: str = "pages", chunk_size: int = 1,
+              ranges: Sequence[str] | None = None, progress: ProgressCallback | None = None,
+              cancel_event: threading.Event | None = None) -> str:
+    """Split the PDF into several files and return the output directory.
+
+    ``mode`` selects the strategy: ``"pages"`` writes one file per page,
+    ``"chunks"`` one file per ``chunk_size`` pages, ``"ranges"`` one file per
+    :func:`parse_page_ranges` spec in ``ranges`` and ``"bookmarks"`` one file per
+    top-level outline entry. The files go into a new ``<stem>_<kind>`` folder
+    under ``output_dir``, named after the mode (``_pages``, ``_chunks``,
+    ``_ranges`` or ``_sections``) so splits of one file in different modes do
+    not mix. With ``workers`` above one the parts are sharded across a process
+    pool, each worker opening the source document once.
+
+    ``progress`` counts pages written. When ``cancel_event`` is set the split
+    stops with :class:`OperationCancelled` and the files it wrote are removed;
+    parts only take their final names once every part is written, so files
+    already in the folder are never touched by a cancelled or failed split.
+    """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise PdfOperationError(f"PDF not found: {pdf_path}")
+    if workers < 1:
+        raise PdfOperationError("Worker count must be at least 1")
 
+    parts: List[tuple[str, List[tuple[int, int]]]] = []
+    suffix = _SPLIT_FOLDER_SUFFIXES.get(mode, "parts")
+    output_directory = Path(output_dir) / f"{pdf_path.stem}_{suffix}"
     try:
         with fitz.open(pdf_path) as source:
-            base_name = pdf_path.stem
-            output_directory = _ensure_output_dir(Path(output_dir) / f"{base_name}_pages")
-            for page_number in range(len(source)):
-                output_path = output_directory / f"page_{page_number + 1}.pdf"
-                with fitz.open() as target:
-                    target.insert_pdf(source, from_page=page_number, to_page=page_number)
-                    target.save(output_path)
+            parts = _plan_split(source, mode, chunk_size, ranges)
+            page_count = len(source)
+        tracker = _ProgressTracker(sum(_part_pages(runs) for _, runs in parts), progress, cancel_event)
+        tracker.check()
+        _ensure_output_dir(output_directory)
+        workers = min(workers, len(parts), max(1, page_count // _MIN_PAGES_PER_SPLIT_WORKER))
+        if workers == 1:
+            _write_split_parts(str(pdf_path), str(output_directory), parts, tracker)
+        else:
+            _run_split_shards(str(pdf_path), str(output_directory), parts, workers, tracker)
+        for filename, _ in parts:
+            os.replace(output_directory / _partial_name(filename), output_directory / filename)
+    except PdfOperationError:
+        _remove_partial_outputs(output_directory, parts)
+        raise
     except Exception as exc:
+        _remove_partial_outputs(output_directory, parts)
         raise PdfOperationError(f"Failed to split PDF: {exc}") from exc
 
     return str(output_directory)
 
 
-def rotate_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str,
-               rotation: int) -> str:
-    """Rotate all pages by the provided angle and return the output filepath."""
+def _remove_partial_outputs(output_directory: Path,
+                            parts: Sequence[tuple[str, Sequence[tuple[int, int]]]]) -> None:
+    # Only the unfinished parts are this split's own; files already in the
+    # folder under the final names are left alone.
+    for filename, _ in parts:
+        (output_directory / _partial_name(filename)).unlink(missing_ok=True)
+    try:
+        output_directory.rmdir()
+    except OSError:
+        pass  # Not empty: the folder held files before this split.
+
+
+def rotate_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str | None,
+               rotation: int, progress: ProgressCallback | None = None,
+               cancel_event: threading.Event | None = None, pages: Iterable[int] | None = None,
+               in_place: bool = False) -> str:
+    """Set the rotation of ``pages`` (1-based, all by default) and return the output filepath.
+
+    The output is a byte copy of the input with only the changed page objects
+    appended as an incremental update, so the cost depends on the pages
+    rotated rather than on the file size. With ``in_place`` the update is
+    appended to ``pdf_path`` itself and ``output_dir`` is ignored. Files that
+    PyMuPDF has to repair on opening cannot be updated incrementally; they are
+    rewritten in full, or refused when ``in_place`` is set.
+
+    ``progress`` and ``cancel_event`` behave as for :func:`merge_pdfs`; a
+    cancelled in-place rotation leaves the file untouched.
+    """
     pdf_path = Path(pdf_path)
     if rotation % 90 != 0:
         raise PdfOperationError("Rotation angle must be a multiple of 90 degrees")
@@ -184,43 +714,306 @@ def rotate_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] |
         raise PdfOperationError(f"PDF not found: {pdf_path}")
 
     rotation = rotation % 360
-    output_directory = _ensure_output_dir(output_dir)
-    output_path = output_directory / f"{pdf_path.stem}_rotated.pdf"
+    if in_place:
+        output_path = pdf_path
+    elif output_dir is None:
+        raise PdfOperationError("No output folder given")
+    else:
+        output_path = _ensure_output_dir(output_dir) / f"{pdf_path.stem}_rotated.pdf"
+        if output_path.resolve() == pdf_path.resolve():
+            raise PdfOperationError(f"Output would overwrite {pdf_path.name}; use in_place instead")
+    rewrite_path = output_path.with_name(f".{output_path.name}.tmp")
 
     try:
-        with fitz.open(pdf_path) as source:
-            for page in source:
-                page.set_rotation(rotation)
-            source.save(output_path)
+        if not in_place:
+            shutil.copyfile(pdf_path, output_path)
+        with fitz.open(output_path) as document:
+            page_count = len(document)
+            indices = range(page_count) if pages is None else sorted({int(p) - 1 for p in pages})
+            if not indices:
+                raise PdfOperationError("No pages to rotate")
+            if indices[0] < 0 or indices[-1] >= page_count:
+                page = indices[0] + 1 if indices[0] < 0 else indices[-1] + 1
+                raise PdfOperationError(f"Page {page} out of range. Document has {page_count} pages.")
+            incremental = document.can_save_incrementally()
+            if in_place and not incremental:
+                raise PdfOperationError(
+                    f"{pdf_path.name} is damaged and cannot be rotated in place"
+                )
+
+            tracker = _ProgressTracker(len(indices), progress, cancel_event)
+            changed = False
+            for index in indices:
+                page = document[index]
+                if page.rotation != rotation:
+                    page.set_rotation(rotation)
+                    changed = True
+                tracker.advance()
+            tracker.check()
+            if not incremental:
+                document.save(rewrite_path)
+            elif changed:
+                document.saveIncr()
+        if not incremental:
+            os.replace(rewrite_path, output_path)
+    except PdfOperationError:
+        rewrite_path.unlink(missing_ok=True)
+        if not in_place:
+            output_path.unlink(missing_ok=True)
+        raise
     except Exception as exc:
-        if output_path.exists():
+        rewrite_path.unlink(missing_ok=True)
+        if not in_place:
             output_path.unlink(missing_ok=True)
         raise PdfOperationError(f"Failed to rotate PDF: {exc}") from exc
 
     return str(output_path)
 
 
-def compress_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str) -> tuple[str, float]:
-    """Compress the PDF and return the output path plus percentage reduction."""
+def _plan_image_downsampling(document: fitz.Document, target_dpi: int,
+                             threshold: float) -> List[tuple[List[int], float]]:
+    """Group identical images and return ``(xrefs, scale)`` for those drawn above
+    ``threshold`` times ``target_dpi``.
+
+    An image's resolution is taken where it is drawn largest, so no placement
+    drops below ``target_dpi``. Image masks, 1-bit images and images with a
+    colour-key mask are left alone, as JPEG would damage them.
+    """
+    resolutions: dict[int, float] = {}
+    for page in document:
+        for info in page.get_image_info(xrefs=True):
+            xref = info["xref"]
+            a, b, c, d, _, _ = info["transform"]
+            drawn_width, drawn_height = math.hypot(a, b), math.hypot(c, d)
+            if not xref or not drawn_width or not drawn_height:
+                continue  # Inline or invisible image.
+            dpi = min(info["width"] * 72 / drawn_width, info["height"] * 72 / drawn_height)
+            resolutions[xref] = min(dpi, resolutions.get(xref, dpi))
+
+    groups: dict[bytes, tuple[List[int], float]] = {}
+    for xref, dpi in resolutions.items():
+        if (document.xref_get_key(xref, "ImageMask")[1] == "true"
+                or document.xref_get_key(xref, "BitsPerComponent")[1] == "1"
+                or document.xref_get_key(xref, "Mask")[0] == "array"):
+            continue
+        digest = hashlib.sha1(document.xref_stream_raw(xref))
+        digest.update(document.xref_object(xref, compressed=True).encode())
+        xrefs, lowest_dpi = groups.get(digest.digest(), ([], dpi))
+        xrefs.append(xref)
+        groups[digest.digest()] = (xrefs, min(dpi, lowest_dpi))
+    return [
+        (xrefs, target_dpi / dpi)
+        for xrefs, dpi in groups.values()
+        if dpi > target_dpi * threshold
+    ]
+
+
+def _iter_resampled_images(pdf_path: str, jobs: Sequence[tuple[int, float]],
+                           quality: int) -> Iterator[tuple[int, bytes, int, int, int]]:
+    """Yield ``(xref, jpeg, width, height, components)`` for each ``(xref, scale)`` job."""
+    from PIL import Image
+
+    with fitz.open(pdf_path) as document:
+        for xref, scale in jobs:
+            pixmap = fitz.Pixmap(document, xref)
+            if pixmap.alpha:
+                pixmap = fitz.Pixmap(pixmap, 0)
+            if pixmap.n not in (1, 3):
+                pixmap = fitz.Pixmap(fitz.csRGB, pixmap)
+            image = pixmap.pil_image()
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=quality, optimize=True)
+            yield xref, buffer.getvalue(), size[0], size[1], pixmap.n
+
+
+def _iter_resampled_chunks(pdf_path: Path, jobs: Sequence[tuple[int, float]], quality: int,
+                           workers: int, tracker: _ProgressTracker) -> Iterator[list]:
+    workers = min(workers, max(1, len(jobs) // _MIN_IMAGES_PER_COMPRESS_WORKER))
+    if workers <= 1:
+        for result in _iter_resampled_images(str(pdf_path), jobs, quality):
+            tracker.check()
+            yield [result]
+        return
+
+    # Interleaved shards spread the large images of a scan evenly over the workers.
+    shard_count = min(len(jobs), workers * 4)
+    shards = [jobs[index::shard_count] for index in range(shard_count)]
+    with _process_pool(workers) as executor:
+        pending = {
+            executor.submit(_collect_chunk, _iter_resampled_images, str(pdf_path), shard, quality)
+            for shard in shards
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                tracker.check()
+                for future in done:
+                    yield future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _replace_image_stream(document: fitz.Document, xref: int, jpeg: bytes, width: int,
+                          height: int, components: int) -> None:
+    # Rewriting the stream in place keeps every reference to the image, and its /SMask, valid.
+    document.update_stream(xref, jpeg, compress=False)
+    document.xref_set_key(xref, "Filter", "/DCTDecode")
+    for key in ("DecodeParms", "Decode"):
+        if document.xref_get_key(xref, key)[0] != "null":
+            document.xref_set_key(xref, key, "null")
+    document.xref_set_key(xref, "Width", str(width))
+    document.xref_set_key(xref, "Height", str(height))
+    document.xref_set_key(xref, "BitsPerComponent", "8")
+    document.xref_set_key(xref, "ColorSpace", "/DeviceGray" if components == 1 else "/DeviceRGB")
+
+
+def _downsample_images(document: fitz.Document, pdf_path: Path,
+                       groups: Sequence[tuple[List[int], float]], quality: int, workers: int,
+                       tracker: _ProgressTracker) -> None:
+    xrefs_by_key = {xrefs[0]: xrefs for xrefs, _ in groups}
+    jobs = [(xrefs[0], scale) for xrefs, scale in groups]
+
+    results = _iter_resampled_chunks(pdf_path, jobs, quality, workers, tracker)
+    with closing(results):
+        for chunk in results:
+            for xref, jpeg, width, height, components in chunk:
+                if len(jpeg) < len(document.xref_stream_raw(xref)):
+                    # Duplicates get the same bytes and are merged by the garbage-collecting save.
+                    for duplicate in xrefs_by_key[xref]:
+                        _replace_image_stream(document, duplicate, jpeg, width, height, components)
+            tracker.advance(len(chunk))
+
+
+def _write_compressed(pdf_path: Path, output_path: Path,
+                      image_settings: tuple[int, int, float] | None, workers: int,
+                      tracker: _ProgressTracker) -> int:
+    """Save a compressed copy of ``pdf_path`` to ``output_path`` and return its size.
+
+    ``image_settings`` is ``(target DPI, JPEG quality, threshold)``, or ``None``
+    to leave images and fonts alone. ``tracker`` counts resampled images plus
+    the save, which is reported by the caller.
+    """
+    with fitz.open(pdf_path) as source:
+        tracker.check()
+        groups: List[tuple[List[int], float]] = []
+        if image_settings is not None:
+            target_dpi, quality, threshold = image_settings
+            groups = _plan_image_downsampling(source, target_dpi, threshold)
+        tracker.total = len(groups) + 1
+        if tracker.progress is not None:
+            tracker.progress(0, tracker.total)
+        if image_settings is not None:
+            _downsample_images(source, pdf_path, groups, quality, workers, tracker)
+            source.subset_fonts()
+            tracker.check()
+        source.save(
+            output_path,
+            garbage=4,
+            deflate=True,
+            clean=True,
+            use_objstms=True,
+        )
+    return output_path.stat().st_size
+
+
+def _write_to_target_size(pdf_path: Path, output_path: Path, target_size: int, workers: int,
+                          tracker: _ProgressTracker) -> None:
+    """Write the best-quality step of :data:`_TARGET_SIZE_STEPS` that fits ``target_size``.
+
+    A lossless rewrite is tried first; otherwise the steps are binary searched,
+    assuming the output shrinks as DPI and quality drop, so a file is written
+    at most four times. If even the last step is too big, its output is kept.
+    ``tracker`` counts those attempts.
+    """
+    attempt = _ProgressTracker(1, None, tracker.cancel_event)
+    tracker.total = 1 + math.ceil(math.log2(len(_TARGET_SIZE_STEPS) + 1))
+    if tracker.progress is not None:
+        tracker.progress(0, tracker.total)
+    if _write_compressed(pdf_path, output_path, None, workers, attempt) <= target_size:
+        return
+    tracker.advance()
+
+    probe_path = output_path.with_name(f".{output_path.name}.probe")
+    low, high = 0, len(_TARGET_SIZE_STEPS) - 1
+    fitted = False
+    try:
+        while low <= high:
+            middle = (low + high) // 2
+            dpi, quality = _TARGET_SIZE_STEPS[middle]
+            # Every image above the step's DPI is resampled, so sizes fall step by step.
+            size = _write_compressed(pdf_path, probe_path, (dpi, quality, 1.0), workers, attempt)
+            tracker.advance()
+            if size <= target_size:
+                os.replace(probe_path, output_path)
+                fitted = True
+                high = middle - 1
+            else:
+                low = middle + 1
+        if not fitted:
+            # The search ended on the last, smallest step.
+            os.replace(probe_path, output_path)
+    finally:
+        probe_path.unlink(missing_ok=True)
+
+
+def compress_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str,
+                 progress: ProgressCallback | None = None,
+                 cancel_event: threading.Event | None = None,
+                 profile: str = "lossless", workers: int = 1,
+                 target_size: int | None = None) -> tuple[str, float]:
+    """Compress the PDF and return the output path plus percentage reduction.
+
+    Every profile (see :data:`COMPRESSION_PROFILES`) rewrites the file with
+    garbage collection, deflated streams and object streams, which also merges
+    identical objects. ``"lossless"`` stops there. ``"screen"``, ``"ebook"``
+    and ``"print"`` also downsample images drawn above 1.5 times 72, 150 or
+    300 DPI to that resolution and recompress them as JPEG, resampling on a
+    process pool with ``workers`` above one, and subset the embedded fonts.
+
+    With ``target_size`` (in bytes) the profile is ignored: image DPI and JPEG
+    quality are searched for the best quality whose output fits, keeping the
+    smallest output if none does.
+
+    ``progress`` counts resampled images plus the final save (attempts, with
+    ``target_size``), and ``cancel_event`` is honoured between them.
+    """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise PdfOperationError(f"PDF not found: {pdf_path}")
+    if profile not in COMPRESSION_PROFILES:
+        raise PdfOperationError(f"Unsupported compression profile: {profile}")
+    if workers < 1:
+        raise PdfOperationError("Worker count must be at least 1")
+    if target_size is not None and target_size < 1:
+        raise PdfOperationError("Target size must be at least one byte")
 
     output_directory = _ensure_output_dir(output_dir)
     output_path = output_directory / f"{pdf_path.stem}_compressed.pdf"
 
     try:
         original_size = pdf_path.stat().st_size
-        with fitz.open(pdf_path) as source:
-            source.save(
-                output_path,
-                garbage=4,
-                deflate=True,
-                clean=True,
-                linear=True,
-            )
+        tracker = _ProgressTracker(1, progress, cancel_event)
+        if target_size is not None:
+            _write_to_target_size(pdf_path, output_path, target_size, workers, tracker)
+        else:
+            image_settings = None
+            if profile != "lossless":
+                image_settings = (*_PROFILE_SETTINGS[profile], _DOWNSAMPLE_THRESHOLD)
+            _write_compressed(pdf_path, output_path, image_settings, workers, tracker)
         compressed_size = output_path.stat().st_size
         ratio = 0.0 if original_size == 0 else (1 - compressed_size / original_size) * 100
+        if progress is not None:
+            progress(tracker.total, tracker.total)
+    except OperationCancelled:
+        if target_size is not None:
+            # An earlier attempt may already have been written.
+            output_path.unlink(missing_ok=True)
+        raise
+    except PdfOperationError:
+        raise
     except Exception as exc:
         if output_path.exists():
             output_path.unlink(missing_ok=True)
@@ -229,67 +1022,456 @@ def compress_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str]
     return str(output_path), ratio
 
 
+def compress_pdfs(pdf_paths: Sequence[os.PathLike[str] | str], output_dir: os.PathLike[str] | str,
+                  profile: str = "lossless", target_size: int | None = None, workers: int = 1,
+                  progress: ProgressCallback | None = None,
+                  cancel_event: threading.Event | None = None) -> List[tuple[str, float]]:
+    """Compress several PDFs with :func:`compress_pdf` and return ``(path, ratio)`` for each.
+
+    With ``workers`` above one the files are compressed on a process pool,
+    one file per worker; a single file gets the workers for its images instead.
+    ``progress`` counts files. When ``cancel_event`` is set, files already
+    being compressed finish, then :class:`OperationCancelled` is raised and the
+    outputs written by the batch are removed.
+    """
+    paths = [Path(path) for path in pdf_paths]
+    if not paths:
+        raise PdfOperationError("No PDFs to compress")
+    if workers < 1:
+        raise PdfOperationError("Worker count must be at least 1")
+    stems = [path.stem for path in paths]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        raise PdfOperationError(
+            "Several inputs would be written to the same output: " + ", ".join(duplicates)
+        )
+
+    if len(paths) == 1:
+        return [compress_pdf(paths[0], output_dir, progress, cancel_event, profile, workers,
+                             target_size)]
+
+    tracker = _ProgressTracker(len(paths), progress, cancel_event)
+    results: dict[int, tuple[str, float]] = {}
+    try:
+        with _process_pool(min(workers, len(paths))) as executor:
+            pending = {
+                executor.submit(compress_pdf, path, output_dir, profile=profile,
+                                target_size=target_size): index
+                for index, path in enumerate(paths)
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    tracker.check()
+                    for future in done:
+                        index = pending.pop(future)
+                        try:
+                            results[index] = future.result()
+                        except PdfOperationError as exc:
+                            raise PdfOperationError(f"{paths[index].name}: {exc}") from exc
+                        tracker.advance()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                # Files that were mid-way have finished now; note them for clean-up.
+                for future, index in pending.items():
+                    if not future.cancelled() and future.exception() is None:
+                        results[index] = future.result()
+                raise
+    except OperationCancelled:
+        for output_path, _ in results.values():
+            Path(output_path).unlink(missing_ok=True)
+        raise
+    return [results[index] for index in range(len(paths))]
+
+
+def _iter_page_texts(pdf_path: str, backend: str, first: int, last: int) -> Iterator[str]:
+    """Yield the text of pages ``first``..``last`` (0-based, inclusive)."""
+    if backend == "pymupdf":
+        with fitz.open(pdf_path) as document:
+            for index in range(first, last + 1):
+                yield document[index].get_text()
+        return
+
+    import pdfplumber
+
+    # Restricting the parse keeps each chunk from building Page objects for the whole file.
+    with pdfplumber.open(pdf_path, pages=range(first + 1, last + 2)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            page.close()  # Drops the page's cached layout objects.
+
+
+def _iter_slide_images(pdf_path: str, dpi: int, first: int,
+                       last: int) -> Iterator[tuple[bytes, float, float]]:
+    """Yield ``(JPEG bytes, width pt, height pt)`` for pages ``first``..``last``."""
+    with fitz.open(pdf_path) as document:
+        for index in range(first, last + 1):
+            page = document[index]
+            pixmap = page.get_pixmap(dpi=dpi, alpha=False)
+            # Pillow (a python-pptx dependency) encodes JPEG several times faster than MuPDF.
+            yield pixmap.pil_tobytes("JPEG", quality=85), page.rect.width, page.rect.height
+
+
+def _iter_page_tables(pdf_path: str, backend: str, first: int,
+                      last: int) -> Iterator[List[List[List[str | None]]]]:
+    """Yield the tables found on each of pages ``first``..``last`` as lists of rows."""
+    if backend == "pymupdf":
+        with fitz.open(pdf_path) as document:
+            for index in range(first, last + 1):
+                yield [table.extract() for table in document[index].find_tables().tables]
+        return
+
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path, pages=range(first + 1, last + 2)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_tables()
+            page.close()
+
+
+def _parse_docx_pages(converter: Any, first: int, last: int) -> Iterator[Any]:
+    """Parse pages ``first``..``last`` of a pdf2docx ``converter``, yielding each page.
+
+    This follows ``Converter.parse``, but page by page, so progress can be
+    reported as it goes. Unlike pdf2docx's default, which logs a page that
+    fails to parse and leaves it out of the document, the failure is raised
+    as :class:`PdfOperationError` naming the page.
+    """
+    settings = converter.default_settings
+    converter.load_pages(first, last + 1)
+    converter.parse_document(**settings)
+    for page in converter.pages:
+        if page.skip_parsing:
+            continue
+        try:
+            page.parse(**settings)
+        except Exception as exc:
+            raise PdfOperationError(f"Unable to convert page {page.id + 1} to Word: {exc}") from exc
+        yield page
+
+
+def _iter_docx_pages(pdf_path: str, first: int, last: int) -> Iterator[dict]:
+    """Yield pdf2docx's parsed layout of pages ``first``..``last``."""
+    from pdf2docx import Converter
+
+    converter = Converter(pdf_path)
+    try:
+        for page in _parse_docx_pages(converter, first, last):
+            yield page.store()
+    finally:
+        converter.close()
+
+
+def _collect_chunk(iter_function: Callable[..., Iterator], *args: Any) -> list:
+    return list(iter_function(*args))
+
+
+def _wait_for(future: Future, tracker: _ProgressTracker) -> list:
+    while True:
+        done, _ = wait([future], timeout=0.2)
+        tracker.check()
+        if done:
+            return future.result()
+
+
+def _convert_workers(workers: int, page_count: int) -> int:
+    return min(workers, max(1, page_count // _MIN_PAGES_PER_CONVERT_WORKER))
+
+
+def _iter_chunk_results(iter_function: Callable[..., Iterator], pdf_path: Path, options: tuple,
+                        page_count: int, workers: int,
+                        tracker: _ProgressTracker) -> Iterator[list]:
+    """Yield the per-page results of ``iter_function`` in page order, as lists.
+
+    ``iter_function(pdf_path, *options, first, last)`` yields one result per
+    page. Without extra ``workers`` it runs once over the whole document and
+    every page is yielded on its own. Otherwise consecutive page chunks run on
+    a process pool, each worker opening the PDF itself; only two chunks per
+    worker are in flight and each is yielded as soon as the chunks before it
+    are, so memory stays bounded however long the document is.
+    """
+    workers = _convert_workers(workers, page_count)
+    if workers <= 1:
+        for result in iter_function(str(pdf_path), *options, 0, page_count - 1):
+            tracker.check()
+            yield [result]
+        return
+
+    chunk_pages = max(1, min(_MAX_CONVERT_CHUNK_PAGES, -(-page_count // (workers * 4))))
+    chunks = iter([
+        (start, min(start + chunk_pages, page_count) - 1)
+        for start in range(0, page_count, chunk_pages)
+    ])
+
+    with _process_pool(workers) as executor:
+        in_flight: deque[Future] = deque()
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                in_flight.append(
+                    executor.submit(_collect_chunk, iter_function, str(pdf_path), *options, *chunk)
+                )
+
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+            while in_flight:
+                results = _wait_for(in_flight.popleft(), tracker)
+                submit_next()
+                yield results
+        except BaseException:
+            # Also reached through GeneratorExit when the consumer stops early.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _convert_to_text(pdf_path: Path, output_path: Path, backend: str, workers: int,
+                     tracker: _ProgressTracker) -> None:
+    """Write the text of every page to ``output_path`` in page order.
+
+    Pages are written as they arrive, so the file is removed again if the
+    conversion is cancelled or fails part-way instead of being left truncated.
+    """
+    with fitz.open(pdf_path) as document:
+        tracker.total = len(document)
+
+    results = _iter_chunk_results(
+        _iter_page_texts, pdf_path, (backend,), tracker.total, workers, tracker
+    )
+    try:
+        with closing(results), output_path.open("w", encoding="utf-8") as handle:
+            for texts in results:
+                for text in texts:
+                    handle.write(text)
+                    handle.write("\n\n")
+                tracker.advance(len(texts))
+    except Exception:
+        output_path.unlink(missing_ok=True)
+        raise
+
+
+def _convert_to_word(pdf_path: Path, output_path: Path, workers: int,
+                     tracker: _ProgressTracker) -> None:
+    """Parse pages with pdf2docx (in parallel with ``workers``) and write one docx.
+
+    pdf2docx's own ``multi_processing`` option reports no progress, cannot be
+    stopped and writes its intermediate files to the working directory, so
+    page chunks run on the conversion pool instead and their parsed layouts are
+    restored into a single converter that builds the document. A single
+    worker parses straight into that converter, skipping the round trip.
+    """
+    from pdf2docx import Converter
+
+    converter = Converter(str(pdf_path))
+    try:
+        page_count = len(converter.fitz_doc)
+        tracker.total = page_count
+        if _convert_workers(workers, page_count) <= 1:
+            for _page in _parse_docx_pages(converter, 0, page_count - 1):
+                tracker.advance()
+        else:
+            converter.load_pages()
+            for page in converter.pages:
+                page.skip_parsing = True
+            results = _iter_chunk_results(
+                _iter_docx_pages, pdf_path, (), page_count, workers, tracker
+            )
+            with closing(results):
+                for chunk in results:
+                    for layout in chunk:
+                        converter.pages[layout["id"]].restore(layout)
+                    tracker.advance(len(chunk))
+        converter.make_docx(str(output_path), **converter.default_settings)
+    finally:
+        converter.close()
+
+
+def _convert_to_excel_with_tabula(pdf_path: Path, output_path: Path) -> None:
+    import pandas as pd
+    import tabula
+    from tabula.errors import JavaNotFoundError
+
+    try:
+        tables = tabula.read_pdf(str(pdf_path), pages='all')
+    except JavaNotFoundError as exc:
+        raise PdfOperationError(_JAVA_MISSING_MESSAGE) from exc
+    if not tables:
+        raise PdfOperationError("No tabular data detected in the PDF")
+    with pd.ExcelWriter(output_path) as writer:
+        for index, table in enumerate(tables, start=1):
+            table.to_excel(writer, sheet_name=f"Sheet_{index}", index=False)
+
+
+def _convert_to_excel(pdf_path: Path, output_path: Path, backend: str, workers: int,
+                      tracker: _ProgressTracker) -> None:
+    """Write every table found by an in-process ``backend`` to its own worksheet.
+
+    Pages are searched for tables in order (in parallel with ``workers``) and
+    each table is appended to a write-only openpyxl workbook as soon as its page
+    is done, so neither Java nor the whole set of tables in memory is needed.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    with fitz.open(pdf_path) as document:
+        tracker.total = len(document)
+
+    workbook = Workbook(write_only=True)
+    table_count = 0
+    results = _iter_chunk_results(
+        _iter_page_tables, pdf_path, (backend,), tracker.total, workers, tracker
+    )
+    try:
+        with closing(results):
+            for chunk in results:
+                for tables in chunk:
+                    for rows in tables:
+                        table_count += 1
+                        sheet = workbook.create_sheet(f"Sheet_{table_count}")
+                        for row in rows:
+                            # Extracted text can carry control characters xlsx cannot store.
+                            sheet.append([
+                                ILLEGAL_CHARACTERS_RE.sub("", cell) if cell else cell
+                                for cell in row
+                            ])
+                tracker.advance(len(chunk))
+    except BaseException:
+        # Write-only sheets stream to temporary files; finish them so nothing is left open.
+        for sheet in workbook.worksheets:
+            sheet.close()
+        raise
+    if not table_count:
+        raise PdfOperationError("No tabular data detected in the PDF")
+    workbook.save(output_path)
+
+
+def _convert_to_powerpoint(pdf_path: Path, output_path: Path, slide_mode: str, dpi: int,
+                           workers: int, tracker: _ProgressTracker) -> None:
+    """Build a deck with one slide per page, from page text or rendered page images.
+
+    Pages are extracted or rendered in chunks (see :func:`_iter_chunk_results`)
+    and added to the deck as they arrive. python-pptx still holds every slide,
+    and in ``"image"`` mode every JPEG, in memory until the deck is saved.
+    """
+    from pptx import Presentation
+    from pptx.util import Emu, Inches, Pt
+
+    with fitz.open(pdf_path) as document:
+        tracker.total = len(document)
+        first_page = document[0].rect if len(document) else None
+
+    presentation = Presentation()
+    if slide_mode == "image":
+        if first_page is not None:
+            # PowerPoint accepts slides between 1 and 56 inches on each side.
+            width, height = Pt(first_page.width), Pt(first_page.height)
+            scale = min(1.0, Inches(56) / max(width, height))
+            scale = max(scale, Inches(1) / min(width * scale, height * scale))
+            presentation.slide_width = Emu(int(width * scale))
+            presentation.slide_height = Emu(int(height * scale))
+        layout = presentation.slide_layouts[6]
+        function, options = _iter_slide_images, (dpi,)
+    else:
+        layout = presentation.slide_layouts[5]
+        function, options = _iter_page_texts, ("pdfplumber",)
+
+    slide_width, slide_height = presentation.slide_width, presentation.slide_height
+    results = _iter_chunk_results(function, pdf_path, options, tracker.total, workers, tracker)
+    with closing(results):
+        for chunk in results:
+            for item in chunk:
+                slide = presentation.slides.add_slide(layout)
+                if slide_mode == "image":
+                    image, page_width, page_height = item
+                    fit = min(slide_width / page_width, slide_height / page_height)
+                    width, height = int(page_width * fit), int(page_height * fit)
+                    slide.shapes.add_picture(
+                        io.BytesIO(image),
+                        (slide_width - width) // 2,
+                        (slide_height - height) // 2,
+                        width,
+                        height,
+                    )
+                else:
+                    text_box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(5))
+                    text_frame = text_box.text_frame
+                    text_frame.clear()
+                    text_frame.text = item
+            tracker.advance(len(chunk))
+    presentation.save(output_path)
+
+
 def convert_pdf(pdf_path: os.PathLike[str] | str, output_dir: os.PathLike[str] | str,
-                output_format: str) -> str:
-    """Convert the PDF into the requested format (word, excel, powerpoint, text)."""
+                output_format: str, progress: ProgressCallback | None = None,
+                cancel_event: threading.Event | None = None, workers: int = 1,
+                text_backend: str = "pdfplumber", slide_mode: str = "text",
+                dpi: int = 150, table_backend: str = "tabula") -> str:
+    """Convert the PDF into the requested format (word, excel, powerpoint, text).
+
+    Text is extracted with ``text_backend`` (see :data:`TEXT_BACKENDS`);
+    ``"pymupdf"`` is many times faster than ``"pdfplumber"`` but lays text out
+    slightly differently. PowerPoint slides hold either the page text or, with
+    ``slide_mode="image"``, the page rendered at ``dpi``. Excel tables are
+    found by ``table_backend`` (see :data:`TABLE_BACKENDS`): ``"tabula"``
+    launches Java, ``"pymupdf"`` and ``"pdfplumber"`` run in-process. With
+    ``workers`` above one, pages are processed on a process pool for every
+    format except tabula's Excel.
+
+    Conversions report ``progress`` per page and stop between pages once
+    ``cancel_event`` is set; tabula's Excel conversion runs as a single step,
+    reporting ``(0, 1)`` and ``(1, 1)``.
+    """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise PdfOperationError(f"PDF not found: {pdf_path}")
 
+    if workers < 1:
+        raise PdfOperationError("Worker count must be at least 1")
+    if text_backend not in TEXT_BACKENDS:
+        raise PdfOperationError(f"Unsupported text backend: {text_backend}")
+    if table_backend not in TABLE_BACKENDS:
+        raise PdfOperationError(f"Unsupported table backend: {table_backend}")
+    if slide_mode not in SLIDE_MODES:
+        raise PdfOperationError(f"Unsupported slide mode: {slide_mode}")
+    if not 36 <= dpi <= 600:
+        raise PdfOperationError("Slide resolution must be between 36 and 600 DPI")
+
     output_directory = _ensure_output_dir(output_dir)
     fmt = output_format.lower()
+    tracker = _ProgressTracker(1, progress, cancel_event)
+    output_path: Path | None = None
+    # tabula runs as one library call, so progress only marks the start and end.
+    single_step = fmt == "excel" and table_backend == "tabula"
 
     try:
+        tracker.check()
+        if single_step and progress is not None:
+            progress(0, 1)
         if fmt == "word":
             output_path = output_directory / f"{pdf_path.stem}.docx"
-            cv = Converter(str(pdf_path))
-            try:
-                cv.convert(str(output_path))
-            finally:
-                cv.close()
+            _convert_to_word(pdf_path, output_path, workers, tracker)
         elif fmt == "excel":
             output_path = output_directory / f"{pdf_path.stem}.xlsx"
-            try:
-                tables = tabula.read_pdf(str(pdf_path), pages='all')
-            except JavaNotFoundError as exc:
-                raise PdfOperationError(
-                    "Java is required for Excel conversion but was not found. "
-                    "Install Java and ensure it is on your PATH."
-                ) from exc
-            if not tables:
-                raise PdfOperationError("No tabular data detected in the PDF")
-            with pd.ExcelWriter(output_path) as writer:
-                for index, table in enumerate(tables, start=1):
-                    table.to_excel(writer, sheet_name=f"Sheet_{index}", index=False)
+            if table_backend == "tabula":
+                _convert_to_excel_with_tabula(pdf_path, output_path)
+            else:
+                _convert_to_excel(pdf_path, output_path, table_backend, workers, tracker)
         elif fmt == "powerpoint":
             output_path = output_directory / f"{pdf_path.stem}.pptx"
-            presentation = Presentation()
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    slide = presentation.slides.add_slide(presentation.slide_layouts[5])
-                    text_box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(5))
-                    text_frame = text_box.text_frame
-                    text = page.extract_text() or ""
-                    text_frame.clear()
-                    text_frame.text = text
-            presentation.save(output_path)
+            _convert_to_powerpoint(pdf_path, output_path, slide_mode, dpi, workers, tracker)
         elif fmt == "text":
             output_path = output_directory / f"{pdf_path.stem}.txt"
-            with pdfplumber.open(pdf_path) as pdf, output_path.open("w", encoding="utf-8") as handle:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    handle.write(text)
-                    handle.write("\n\n")
+            _convert_to_text(pdf_path, output_path, text_backend, workers, tracker)
         else:
             raise PdfOperationError(f"Unsupported output format: {output_format}")
+        if single_step and progress is not None:
+            progress(1, 1)
     except PdfOperationError:
         raise
     except Exception as exc:
-        if 'java' in str(exc).lower():
-            raise PdfOperationError(
-                "Java is required for Excel conversion but was not found. "
-                "Install Java and ensure it is on your PATH."
-            ) from exc
+        if fmt == "excel" and table_backend == "tabula" and 'java' in str(exc).lower():
+            raise PdfOperationError(_JAVA_MISSING_MESSAGE) from exc
         raise PdfOperationError(f"Failed to convert PDF: {exc}") from exc
 
     return str(output_path)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable
+
+from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtGui import QImage
+
+__all__ = ["DiskImageCache", "default_cache_directory"]
+
+
+def default_cache_directory() -> Path:
+    """Return the per-user cache folder matching the app's QSettings scope."""
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    return Path(base or Path.home() / ".cache") / "PdfCombiner" / "PdfToolkit" / "render_cache"
+
+
+class DiskImageCache:
+    """Content-addressed on-disk image cache with a byte budget and LRU eviction.
+
+    Keys are arbitrary hashable tuples (typically a file digest plus render
+    options) hashed to a file name. A file's mtime is its last use, so the least
+    recently read images are evicted first once the budget is exceeded. All
+    methods are safe to call from worker threads; :meth:`put_later` hands the
+    encoding and writing to a background thread.
+    """
+
+    def __init__(self, directory: os.PathLike[str] | str | None = None,
+                 max_bytes: int = 512 * 1024 * 1024, write_delay: float = 0.5) -> None:
+        self.directory = Path(directory) if directory else default_cache_directory()
+        self.max_bytes = max_bytes
+        self.write_delay = write_delay
+        self._total_bytes: int | None = None
+        self._lock = threading.Lock()
+        self._queued: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._queue_changed = threading.Condition()
+        self._writer: threading.Thread | None = None
+        self._writing = False
+        self._flushing = 0
+
+    def _path(self, key: Hashable) -> Path:
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self.directory / name[:2] / name
+
+    def get(self, key: Hashable) -> QImage | None:
+        path = self._path(key)
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def put(self, key: Hashable, image: QImage, fmt: str = "PNG", quality: int = -1) -> None:
+        path = self._path(key)
+        temporary = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(temporary), fmt, quality):
+                return
+            size = temporary.stat().st_size
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(temporary, path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += size - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def put_later(self, key: Hashable, image: QImage, fmt: str = "PNG", quality: int = -1,
+                  slot: Hashable | None = None) -> None:
+        """Queue :meth:`put` on the background writer and return immediately.
+
+        Writes wait ``write_delay`` seconds in the queue and are replaced by a
+        newer one with the same ``slot`` (``key`` by default), so a burst of
+        renders of one page at changing sizes, such as a window being resized,
+        only persists the last of them.
+        """
+        with self._queue_changed:
+            slot = key if slot is None else slot
+            self._queued.pop(slot, None)
+            self._queued[slot] = (time.monotonic(), key, image, fmt, quality)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_queued, name="DiskImageCache writer", daemon=True
+                )
+                self._writer.start()
+            self._queue_changed.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write every queued image now and wait for it; return False on timeout."""
+        with self._queue_changed:
+            self._flushing += 1
+            self._queue_changed.notify_all()
+            try:
+                return self._queue_changed.wait_for(
+                    lambda: not self._queued and not self._writing, timeout
+                )
+            finally:
+                self._flushing -= 1
+
+    def _write_queued(self) -> None:
+        while True:
+            with self._queue_changed:
+                self._writing = False
+                self._queue_changed.notify_all()
+                while True:
+                    self._queue_changed.wait_for(lambda: self._queued)
+                    slot, (queued_at, *write) = next(iter(self._queued.items()))
+                    remaining = queued_at + self.write_delay - time.monotonic()
+                    if remaining <= 0 or self._flushing:
+                        break
+                    self._queue_changed.wait(remaining)
+                del self._queued[slot]
+                self._writing = True
+            self.put(*write)
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry, _, _ in self._entries():
+                Path(entry).unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        entries: list[tuple[str, float, int]] = []
+        if not self.directory.is_dir():
+            return entries
+        with os.scandir(self.directory) as buckets:
+            for bucket in buckets:
+                if not bucket.is_dir():
+                    continue
+                with os.scandir(bucket.path) as files:
+                    for item in files:
+                        if item.is_file() and not item.name.endswith(".tmp"):
+                            stat = item.stat()
+                            entries.append((item.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self) -> None:
+        # Trim to 90% of the budget so a full cache does not rescan on every put.
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Callable, List
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+from PyQt6.QtWidgets import (
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QProgressBar,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pdf_combiner.ui.workers import Worker
+
+__all__ = ["Job", "JobQueue", "JobsPanel"]
+
+
+class Job(QObject):
+    """One queued operation with its own progress, state and cancel event.
+
+    ``function`` is called on the thread pool as
+    ``function(progress=..., cancel_event=...)``, matching the keyword
+    arguments of the ``pdf_ops`` functions.
+    """
+
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    changed = pyqtSignal()
+
+    def __init__(self, label: str, function: Callable[..., Any],
+                 on_success: Callable[[Any], None] | None = None,
+                 on_error: Callable[[str], None] | None = None,
+                 parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.label = label
+        self.function = function
+        self.on_success = on_success
+        self.on_error = on_error
+        self.state = Job.QUEUED
+        self.done = 0
+        self.total = 0
+        self.cancel_event = threading.Event()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (Job.DONE, Job.FAILED, Job.CANCELLED)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        self.changed.emit()
+
+
+class JobQueue(QObject):
+    """Runs jobs at most ``max_concurrent`` at a time, in FIFO order.
+
+    Jobs get a thread pool of their own, sized to ``max_concurrent``, so long
+    merges and conversions never occupy the shared pool that renders previews
+    and thumbnails.
+    """
+
+    jobAdded = pyqtSignal(object)
+
+    def __init__(self, max_concurrent: int = 2, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._max_concurrent = max(1, max_concurrent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self._max_concurrent)
+        self._pending: deque[Job] = deque()
+        self._running: List[Job] = []
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def set_max_concurrent(self, value: int) -> None:
+        self._max_concurrent = max(1, value)
+        self.thread_pool.setMaxThreadCount(self._max_concurrent)
+        self._start_next()
+
+    def submit(self, label: str, function: Callable[..., Any],
+               on_success: Callable[[Any], None] | None = None,
+               on_error: Callable[[str], None] | None = None) -> Job:
+        job = Job(label, function, on_success, on_error, parent=self)
+        self._pending.append(job)
+        self.jobAdded.emit(job)
+        self._start_next()
+        return job
+
+    def cancel(self, job: Job) -> None:
+        if job in self._pending:
+            self._pending.remove(job)
+            job._set_state(Job.CANCELLED)
+        elif job.state == Job.RUNNING:
+            # The operation notices at its next checkpoint and cleans up after itself.
+            job.cancel_event.set()
+            job.changed.emit()
+
+    def cancel_all(self) -> None:
+        for job in list(self._pending) + list(self._running):
+            self.cancel(job)
+
+    def active_count(self) -> int:
+        return len(self._pending) + len(self._running)
+
+    def _start_next(self) -> None:
+        while self._pending and len(self._running) < self._max_concurrent:
+            job = self._pending.popleft()
+            self._running.append(job)
+            job._set_state(Job.RUNNING)
+
+            worker = Worker(job.function, cancel_event=job.cancel_event)
+            worker.kwargs["progress"] = self._throttled(worker.signals.progress.emit)
+            worker.signals.progress.connect(lambda value, job=job: self._on_progress(job, value))
+            worker.signals.result.connect(lambda result, job=job: self._on_result(job, result))
+            worker.signals.error.connect(lambda message, job=job: self._on_error(job, message))
+            worker.signals.finished.connect(lambda job=job: self._on_finished(job))
+            self.thread_pool.start(worker)
+
+    @staticmethod
+    def _throttled(emit: Callable[[Any], None]) -> Callable[[int, int], None]:
+        # Operations report every page; only whole-percent changes reach the UI thread.
+        last_percent = -1
+
+        def report(done: int, total: int) -> None:
+            nonlocal last_percent
+            percent = done * 100 // total if total else 0
+            if percent != last_percent or done >= total:
+                last_percent = percent
+                emit((done, total))
+
+        return report
+
+    def _on_progress(self, job: Job, value: tuple[int, int]) -> None:
+        job.done, job.total = value
+        job.changed.emit()
+
+    def _on_result(self, job: Job, result: Any) -> None:
+        job._set_state(Job.DONE)
+        if job.on_success is not None:
+            job.on_success(result)
+
+    def _on_error(self, job: Job, message: str) -> None:
+        if job.cancel_event.is_set():
+            job._set_state(Job.CANCELLED)
+            return
+        job._set_state(Job.FAILED)
+        if job.on_error is not None:
+            job.on_error(message)
+
+    def _on_finished(self, job: Job) -> None:
+        if job in self._running:
+            self._running.remove(job)
+        self._start_next()
+
+
+class _JobRow(QWidget):
+    def __init__(self, job: Job, queue: JobQueue, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.job = job
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.label = QLabel(job.label)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(lambda: queue.cancel(job))
+
+        layout.addWidget(self.label, 2)
+        layout.addWidget(self.progress_bar, 3)
+        layout.addWidget(self.cancel_button)
+
+        job.changed.connect(self._refresh)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        job = self.job
+        if job.state == Job.RUNNING and job.total:
+            self.progress_bar.setRange(0, job.total)
+            self.progress_bar.setValue(min(job.done, job.total))
+            self.progress_bar.setFormat("%p%")
+        elif job.state == Job.RUNNING:
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 1)
+            self.progress_bar.setValue(1 if job.state == Job.DONE else 0)
+            self.progress_bar.setFormat(job.state)
+        if job.cancel_event.is_set() and not job.is_finished:
+            self.progress_bar.setFormat("Cancelling…")
+        self.cancel_button.setVisible(not job.is_finished)
+        self.cancel_button.setEnabled(not job.cancel_event.is_set())
+
+
+class JobsPanel(QGroupBox):
+    """Lists queued, running and finished jobs with per-job progress and cancel buttons."""
+
+    def __init__(self, queue: JobQueue, parent: QWidget | None = None) -> None:
+        super().__init__("Jobs", parent)
+        self.queue = queue
+        self._rows: List[_JobRow] = []
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+
+        header = QHBoxLayout()
+        header.addWidget(QLabel("Run at once:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 16)
+        self.concurrency_spin.setValue(queue.max_concurrent)
+        self.concurrency_spin.valueChanged.connect(queue.set_max_concurrent)
+        header.addWidget(self.concurrency_spin)
+        header.addStretch()
+        self.clear_button = QPushButton("Clear Finished")
+        self.clear_button.clicked.connect(self.clear_finished)
+        header.addWidget(self.clear_button)
+        layout.addLayout(header)
+
+        self.rows_layout = QVBoxLayout()
+        self.rows_layout.setSpacing(6)
+        layout.addLayout(self.rows_layout)
+
+        queue.jobAdded.connect(self._add_row)
+        self.setVisible(False)
+
+    def clear_finished(self) -> None:
+        for row in [row for row in self._rows if row.job.is_finished]:
+            self._rows.remove(row)
+            self.rows_layout.removeWidget(row)
+            row.deleteLater()
+        self.setVisible(bool(self._rows))
+
+    def _add_row(self, job: Job) -> None:
+        row = _JobRow(job, self.queue, self)
+        self._rows.append(row)
+        self.rows_layout.addWidget(row)
+        self.setVisible(True)
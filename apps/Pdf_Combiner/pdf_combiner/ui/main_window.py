@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
-from PyQt6.QtCore import QEvent, QSettings, Qt, QThreadPool, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QEvent, QSettings, QSize, Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QFont, QImage, QPixmap
 from PyQt6.QtWidgets import (
     QAbstractItemView,
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QGridLayout,
@@ -14,31 +17,74 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QProgressDialog,
     QScrollArea,
+    QSpinBox,
     QSplitter,
     QStatusBar,
     QVBoxLayout,
     QWidget,
 )
 
+from pdf_combiner.services import file_discovery as pdf_discovery
 from pdf_combiner.services import pdf_ops
-from pdf_combiner.ui.widgets import FileListWidget
-from pdf_combiner.ui.preview import PreviewError, render_pdf_page
+from pdf_combiner.services.pdf_index import PdfMetadataIndex
+from pdf_combiner.ui.disk_cache import DiskImageCache
+from pdf_combiner.ui.jobs import JobQueue, JobsPanel
+from pdf_combiner.ui.preview import PreviewCache, PreviewError
+from pdf_combiner.ui.thumbnails import ThumbnailPanel, ThumbnailRenderer
+from pdf_combiner.ui.widgets import FileListModel, FileListView
 from pdf_combiner.ui.workers import Worker
 
 
 class MainWindow(QMainWindow):
     """Main window for the PDF Toolkit application."""
 
+    SPLIT_MODE_LABELS = (
+        ("Every page", "pages"),
+        ("Every N pages", "chunks"),
+        ("Page ranges", "ranges"),
+        ("Top-level bookmarks", "bookmarks"),
+    )
+    COMPRESSION_PROFILE_LABELS = (
+        ("Lossless", "lossless"),
+        ("Screen (72 DPI images)", "screen"),
+        ("eBook (150 DPI images)", "ebook"),
+        ("Print (300 DPI images)", "print"),
+        ("Fit under a size", "target"),
+    )
+    # Options offered under the convert row for each output format, with the
+    # attribute (and conversion/ setting) each one sets.
+    CONVERT_OPTION_LABELS = {
+        "text": ("text_backend", (("pdfplumber (best layout)", "pdfplumber"),
+                                  ("PyMuPDF (fast)", "pymupdf"))),
+        "powerpoint": ("slide_mode", (("Slides with page text", "text"),
+                                      ("Slides with page images", "image"))),
+        "excel": ("table_backend", (("Tabula tables (needs Java)", "tabula"),
+                                    ("PyMuPDF tables", "pymupdf"),
+                                    ("pdfplumber tables", "pdfplumber"))),
+    }
+
     def __init__(self) -> None:
         super().__init__()
         self.settings = QSettings("PdfCombiner", "PdfToolkit")
         self.thread_pool = QThreadPool.globalInstance()
+        # Indexing large batches runs on its own small pool so it never starves
+        # preview and thumbnail rendering on the shared one.
+        self.index_pool = QThreadPool(self)
+        self.index_pool.setMaxThreadCount(2)
+        self._ingest_cancel_events: set[threading.Event] = set()
+        self.pdf_index = PdfMetadataIndex()
+        cache_megabytes = int(self.settings.value("cache/max_megabytes", 512))
+        self.disk_cache = DiskImageCache(max_bytes=cache_megabytes * 1024 * 1024)
+        self.preview_cache = PreviewCache(disk_cache=self.disk_cache)
+        self.job_queue = JobQueue(
+            max_concurrent=int(self.settings.value("performance/max_jobs", 2)),
+            parent=self,
+        )
 
         self.output_directory: str | None = None
         self.last_directory: str = self.settings.value("paths/last_directory", str(Path.home()))
@@ -46,6 +92,22 @@ class MainWindow(QMainWindow):
         self.current_page: int = 0
         self.total_pages: int = 0
         self.page_by_file: dict[str, int] = {}
+        self._preview_generation: int = 0
+        self._preview_busy: bool = False
+        self._pending_preview: tuple[int, str, int, QSize] | None = None
+        self.split_workers: int = int(self.settings.value("performance/split_workers", os.cpu_count() or 1))
+        self.convert_workers: int = int(self.settings.value("performance/convert_workers", os.cpu_count() or 1))
+        self.compress_workers: int = int(self.settings.value("performance/compress_workers", os.cpu_count() or 1))
+        self.text_backend: str = str(self.settings.value("conversion/text_backend", "pdfplumber"))
+        if self.text_backend not in pdf_ops.TEXT_BACKENDS:
+            self.text_backend = "pdfplumber"
+        self.slide_mode: str = str(self.settings.value("conversion/slide_mode", "text"))
+        if self.slide_mode not in pdf_ops.SLIDE_MODES:
+            self.slide_mode = "text"
+        self.slide_dpi: int = int(self.settings.value("conversion/slide_dpi", 150))
+        self.table_backend: str = str(self.settings.value("conversion/table_backend", "tabula"))
+        if self.table_backend not in pdf_ops.TABLE_BACKENDS:
+            self.table_backend = "tabula"
 
         self._build_ui()
         self._load_state()
@@ -111,18 +173,25 @@ class MainWindow(QMainWindow):
             }
             QPushButton:hover { background-color: #245bd1; }
             QPushButton:disabled { background-color: #1f2940; color: #9aa3c0; }
-            QListWidget {
+            QListView {
                 background-color: #141a2d;
                 border: 1px solid #1f2940;
                 border-radius: 6px;
             }
-            QLineEdit, QComboBox {
+            QLineEdit, QComboBox, QSpinBox {
                 background-color: #141a2d;
                 border: 1px solid #1f2940;
                 border-radius: 6px;
                 padding: 6px;
                 min-height: 28px;
             }
+            QProgressBar {
+                background-color: #141a2d;
+                border: 1px solid #1f2940;
+                border-radius: 6px;
+                text-align: center;
+            }
+            QProgressBar::chunk { background-color: #2f6fed; border-radius: 5px; }
             QStatusBar {
                 background-color: #141a2d;
                 border-top: 1px solid #1f2940;
@@ -147,6 +216,8 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self._build_file_group())
         layout.addWidget(self._build_operations_group())
+        self.jobs_panel = JobsPanel(self.job_queue)
+        layout.addWidget(self.jobs_panel)
         layout.addStretch()
         return panel
 
@@ -157,14 +228,19 @@ class MainWindow(QMainWindow):
 
         button_row = QHBoxLayout()
         self.add_files_button = QPushButton("Add PDF Files…")
+        self.add_folder_button = QPushButton("Add Folder…")
+        self.add_folder_button.setToolTip("Add every PDF in a folder and its subfolders")
         self.remove_files_button = QPushButton("Remove Selected")
         self.clear_files_button = QPushButton("Clear List")
         button_row.addWidget(self.add_files_button)
+        button_row.addWidget(self.add_folder_button)
         button_row.addWidget(self.remove_files_button)
         button_row.addWidget(self.clear_files_button)
         v_layout.addLayout(button_row)
 
-        self.file_list = FileListWidget()
+        self.file_model = FileListModel(self)
+        self.file_list = FileListView()
+        self.file_list.setModel(self.file_model)
         self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.file_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.file_list.setAlternatingRowColors(True)
@@ -205,39 +281,85 @@ class MainWindow(QMainWindow):
 
         pages_label = QLabel("Pages to extract (e.g. 1,3,5-7):")
         self.pages_input = QLineEdit()
-        self.pages_input.setPlaceholderText("1-3, 5")
+        self.pages_input.setPlaceholderText("1-3, 5  (use ; for several files)")
         self.extract_button = QPushButton("Extract Pages")
         grid.addWidget(pages_label, 0, 0)
         grid.addWidget(self.pages_input, 0, 1)
         grid.addWidget(self.extract_button, 0, 2)
 
+        self.merge_dedupe_check = QCheckBox("Store shared fonts and images once")
+        self.merge_dedupe_check.setToolTip(
+            "Slower, but much smaller when the files share a letterhead, logo or font"
+        )
+        self.merge_dedupe_check.setChecked(
+            str(self.settings.value("merge/deduplicate", "false")).lower() == "true"
+        )
         self.merge_button = QPushButton("Merge Checked PDFs")
-        grid.addWidget(self.merge_button, 1, 0, 1, 3)
+        grid.addWidget(self.merge_dedupe_check, 1, 0)
+        grid.addWidget(self.merge_button, 1, 1, 1, 2)
 
-        split_label = QLabel("Split the current PDF into individual files:")
+        split_label = QLabel("Split current PDF:")
+        self.split_mode_combo = QComboBox()
+        for label, mode in self.SPLIT_MODE_LABELS:
+            self.split_mode_combo.addItem(label, mode)
         self.split_button = QPushButton("Split PDF")
-        grid.addWidget(split_label, 2, 0, 1, 2)
+        grid.addWidget(split_label, 2, 0)
+        grid.addWidget(self.split_mode_combo, 2, 1)
         grid.addWidget(self.split_button, 2, 2)
 
+        self.split_value_input = QLineEdit()
+        grid.addWidget(self.split_value_input, 3, 0, 1, 3)
+        self._on_split_mode_changed()
+
         rotate_label = QLabel("Rotate current PDF (degrees):")
         self.rotation_combo = QComboBox()
         self.rotation_combo.setEditable(True)
         self.rotation_combo.addItems(["90", "180", "270"])
         self.rotate_button = QPushButton("Rotate PDF")
-        grid.addWidget(rotate_label, 3, 0)
-        grid.addWidget(self.rotation_combo, 3, 1)
-        grid.addWidget(self.rotate_button, 3, 2)
-
-        self.compress_button = QPushButton("Compress PDF")
-        grid.addWidget(self.compress_button, 4, 0, 1, 3)
+        grid.addWidget(rotate_label, 4, 0)
+        grid.addWidget(self.rotation_combo, 4, 1)
+        grid.addWidget(self.rotate_button, 4, 2)
+
+        self.rotate_pages_input = QLineEdit()
+        self.rotate_pages_input.setPlaceholderText("Pages to rotate, e.g. 1,3-5 (all if empty)")
+        grid.addWidget(self.rotate_pages_input, 5, 0, 1, 3)
+
+        compress_label = QLabel("Compress checked PDFs:")
+        self.compress_profile_combo = QComboBox()
+        for label, profile in self.COMPRESSION_PROFILE_LABELS:
+            self.compress_profile_combo.addItem(label, profile)
+        saved_profile = self.compress_profile_combo.findData(
+            self.settings.value("compression/profile", "lossless")
+        )
+        self.compress_profile_combo.setCurrentIndex(max(0, saved_profile))
+        self.compress_button = QPushButton("Compress PDFs")
+        grid.addWidget(compress_label, 6, 0)
+        grid.addWidget(self.compress_profile_combo, 6, 1)
+        grid.addWidget(self.compress_button, 6, 2)
+
+        self.compress_target_spin = QSpinBox()
+        self.compress_target_spin.setRange(1, 10_000)
+        self.compress_target_spin.setSuffix(" MB per file")
+        self.compress_target_spin.setValue(int(self.settings.value("compression/target_mb", 10)))
+        grid.addWidget(self.compress_target_spin, 7, 0, 1, 3)
+        self._on_compress_profile_changed()
 
         convert_label = QLabel("Convert current PDF to:")
         self.format_combo = QComboBox()
         self.format_combo.addItems(["Word", "Excel", "PowerPoint", "Text"])
         self.convert_button = QPushButton("Convert PDF")
-        grid.addWidget(convert_label, 5, 0)
-        grid.addWidget(self.format_combo, 5, 1)
-        grid.addWidget(self.convert_button, 5, 2)
+        grid.addWidget(convert_label, 8, 0)
+        grid.addWidget(self.format_combo, 8, 1)
+        grid.addWidget(self.convert_button, 8, 2)
+
+        self.convert_option_combo = QComboBox()
+        self.slide_dpi_spin = QSpinBox()
+        self.slide_dpi_spin.setRange(36, 600)
+        self.slide_dpi_spin.setSuffix(" DPI")
+        self.slide_dpi_spin.setValue(self.slide_dpi)
+        grid.addWidget(self.convert_option_combo, 9, 0, 1, 2)
+        grid.addWidget(self.slide_dpi_spin, 9, 2)
+        self._on_convert_format_changed()
 
         return group
 
@@ -281,11 +403,15 @@ class MainWindow(QMainWindow):
         nav_row.addWidget(self.next_button)
         preview_layout.addLayout(nav_row)
 
+        self.thumbnail_panel = ThumbnailPanel(ThumbnailRenderer(self.disk_cache, self.thread_pool))
+        preview_layout.addWidget(self.thumbnail_panel)
+
         layout.addWidget(self.preview_group)
         return container
 
     def _connect_signals(self) -> None:
         self.add_files_button.clicked.connect(self._add_files)
+        self.add_folder_button.clicked.connect(self._add_folder)
         self.remove_files_button.clicked.connect(self._remove_selected_files)
         self.clear_files_button.clicked.connect(self._clear_files)
         self.toggle_checks_button.clicked.connect(self._toggle_all_checks)
@@ -293,22 +419,30 @@ class MainWindow(QMainWindow):
         self.move_down_button.clicked.connect(self._move_selected_down)
         self.output_dir_button.clicked.connect(self._choose_output_directory)
 
-        self.file_list.currentItemChanged.connect(lambda *_: self._on_current_item_changed())
-        self.file_list.itemSelectionChanged.connect(self._on_selection_changed)
-        self.file_list.itemChanged.connect(self._on_item_changed)
+        self.file_list.selectionModel().currentChanged.connect(lambda *_: self._on_current_item_changed())
+        self.file_list.selectionModel().selectionChanged.connect(lambda *_: self._on_selection_changed())
+        self.file_model.checkStateToggled.connect(self._on_item_changed)
         self.file_list.filesDropped.connect(self._add_files_from_drop)
-        self.file_list.model().rowsMoved.connect(self._on_rows_moved)
+        self.file_model.orderChanged.connect(self._on_rows_moved)
 
         self.prev_button.clicked.connect(self._show_previous_page)
         self.next_button.clicked.connect(self._show_next_page)
         self.page_input.returnPressed.connect(self._jump_to_page)
+        self.thumbnail_panel.pageActivated.connect(self._show_page)
 
         self.extract_button.clicked.connect(self._extract_pages)
         self.merge_button.clicked.connect(self._merge_checked)
         self.split_button.clicked.connect(self._split_current)
+        self.split_mode_combo.currentIndexChanged.connect(lambda *_: self._on_split_mode_changed())
+        self.compress_profile_combo.currentIndexChanged.connect(
+            lambda *_: self._on_compress_profile_changed()
+        )
         self.rotate_button.clicked.connect(self._rotate_current)
-        self.compress_button.clicked.connect(self._compress_current)
+        self.compress_button.clicked.connect(self._compress_checked)
         self.convert_button.clicked.connect(self._convert_current)
+        self.format_combo.currentIndexChanged.connect(lambda *_: self._on_convert_format_changed())
+        self.convert_option_combo.activated.connect(lambda *_: self._on_convert_option_changed())
+        self.slide_dpi_spin.valueChanged.connect(self._on_slide_dpi_changed)
 
     # ------------------------------------------------------------------ state
     def _load_state(self) -> None:
@@ -330,8 +464,26 @@ class MainWindow(QMainWindow):
         if self.output_directory:
             self.settings.setValue("paths/output_dir", self.output_directory)
         self.settings.setValue("paths/last_directory", self.last_directory)
+        self.settings.setValue("performance/split_workers", self.split_workers)
+        self.settings.setValue("performance/max_jobs", self.job_queue.max_concurrent)
+        self.settings.setValue("performance/convert_workers", self.convert_workers)
+        self.settings.setValue("performance/compress_workers", self.compress_workers)
+        self.settings.setValue("merge/deduplicate", self.merge_dedupe_check.isChecked())
+        self.settings.setValue("compression/profile", self.compress_profile_combo.currentData())
+        self.settings.setValue("compression/target_mb", self.compress_target_spin.value())
+        self.settings.setValue("conversion/text_backend", self.text_backend)
+        self.settings.setValue("conversion/slide_mode", self.slide_mode)
+        self.settings.setValue("conversion/slide_dpi", self.slide_dpi)
+        self.settings.setValue("conversion/table_backend", self.table_backend)
+        self._stop_ingestion()
+        self.job_queue.cancel_all()
+        self.disk_cache.flush(timeout=5)
         super().closeEvent(event)
 
+    def _stop_ingestion(self) -> None:
+        for cancel_event in self._ingest_cancel_events:
+            cancel_event.set()
+
     # ------------------------------------------------------------------ helpers
     def eventFilter(self, source, event):  # noqa: D401 - Qt override
         if source is self.preview_area.viewport() and event.type() == QEvent.Type.Resize:
@@ -355,95 +507,117 @@ class MainWindow(QMainWindow):
             self.last_directory,
             "PDF Files (*.pdf)",
         )
-        if not files:
-            return
+        if files:
+            self._ingest_paths(files)
 
-        added, skipped, last_added = self._add_file_paths(files)
-        if added:
-            if last_added:
-                self.last_directory = str(Path(last_added).parent)
-            self.status_bar.showMessage(f"Added {added} PDF file(s)", 4000)
-            self._update_preview()
-        elif skipped:
-            self.status_bar.showMessage(
-                "No new PDFs added (duplicates or invalid entries).",
-                4000,
-            )
-    def _add_file_paths(self, file_paths: Iterable[str]) -> tuple[int, int, str | None]:
-        added = 0
-        skipped = 0
-        last_added: str | None = None
-        start_row = self.file_list.count()
+    def _add_folder(self) -> None:
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Add PDFs from folder (including subfolders)",
+            self.last_directory,
+        )
+        if folder:
+            self.last_directory = folder
+            self._ingest_paths([folder])
 
-        self.file_list.blockSignals(True)
-        try:
-            for raw_path in file_paths:
-                if not raw_path:
-                    skipped += 1
-                    continue
-                try:
-                    path = Path(raw_path).expanduser().resolve()
-                except (OSError, RuntimeError):
-                    skipped += 1
-                    continue
-                if not path.exists() or path.is_dir() or path.suffix.lower() != '.pdf':
-                    skipped += 1
-                    continue
-                normalized = str(path)
-                if self._contains_file(normalized):
-                    skipped += 1
-                    continue
-                item = QListWidgetItem(path.name)
-                item.setData(Qt.ItemDataRole.UserRole, normalized)
-                item.setFlags(
-                    item.flags()
-                    | Qt.ItemFlag.ItemIsUserCheckable
-                    | Qt.ItemFlag.ItemIsDragEnabled
-                    | Qt.ItemFlag.ItemIsDropEnabled
+    def _add_files_from_drop(self, paths: List[str]) -> None:
+        self._ingest_paths(paths, " via drag and drop")
+
+    def _ingest_paths(self, paths: List[str], source: str = "") -> None:
+        """Discover PDFs under ``paths`` on the thread pool and list them in batches.
+
+        Folders are walked recursively. Nothing touches the filesystem on the UI
+        thread; batches are appended as they arrive and indexed in the
+        background, which is also where unreadable files are flagged.
+        """
+        cancel_event = threading.Event()
+        self._ingest_cancel_events.add(cancel_event)
+        counts = {"added": 0, "duplicates": 0}
+
+        progress = QProgressDialog("Looking for PDF files…", "Stop", 0, 0, self)
+        progress.setWindowTitle("Adding files")
+        progress.setWindowModality(Qt.WindowModality.NonModal)
+        progress.setMinimumDuration(700)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        progress.canceled.connect(cancel_event.set)
+
+        def on_batch(batch: list) -> None:
+            if cancel_event.is_set():
+                return
+            start_row = self.file_model.rowCount()
+            added_paths = self.file_model.append_files(batch)
+            counts["added"] += len(added_paths)
+            counts["duplicates"] += len(batch) - len(added_paths)
+            progress.setLabelText(f"Found {counts['added']} new PDF file(s)…")
+            if not added_paths:
+                return
+            self._index_files(added_paths)
+            if self.file_list.current_row() < 0:
+                self.file_list.set_current_row(start_row)
+                self._update_preview()
+
+        def on_finished(result: tuple[int, int]) -> None:
+            _, skipped = result
+            added = counts["added"]
+            stopped = " (stopped)" if cancel_event.is_set() else ""
+            if added:
+                self.status_bar.showMessage(f"Added {added} PDF file(s){source}{stopped}", 4000)
+            elif skipped or counts["duplicates"]:
+                self.status_bar.showMessage(
+                    f"No new PDFs added (duplicates or invalid entries){stopped}.",
+                    4000,
                 )
-                item.setCheckState(Qt.CheckState.Checked)
-                self.file_list.addItem(item)
-                added += 1
-                last_added = normalized
-        finally:
-            self.file_list.blockSignals(False)
+            else:
+                self.status_bar.showMessage(f"No PDF files found{stopped}.", 4000)
+
+        def on_error(message: str) -> None:
+            QMessageBox.critical(self, "Adding files failed", message)
+
+        def cleanup() -> None:
+            self._ingest_cancel_events.discard(cancel_event)
+            progress.close()
+            progress.deleteLater()
+
+        worker = Worker(pdf_discovery.discover_pdfs, paths, cancel_event=cancel_event)
+        worker.kwargs["on_batch"] = worker.signals.progress.emit
+        worker.signals.progress.connect(on_batch)
+        worker.signals.result.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        worker.signals.finished.connect(cleanup)
+        self.thread_pool.start(worker)
 
-        if added and self.file_list.currentRow() < 0:
-            self.file_list.setCurrentRow(start_row)
+    def _index_files(self, paths: List[str]) -> None:
+        worker = Worker(self.pdf_index.warm, paths)
+        worker.signals.result.connect(
+            lambda indexed, requested=paths: self._on_files_indexed(requested, indexed)
+        )
+        self.index_pool.start(worker)
 
-        return added, skipped, last_added
-
-    def _add_files_from_drop(self, paths: List[str]) -> None:
-        added, skipped, last_added = self._add_file_paths(paths)
-        if added:
-            if last_added:
-                self.last_directory = str(Path(last_added).parent)
-            self.status_bar.showMessage(
-                f"Added {added} PDF file(s) via drag and drop",
-                4000,
-            )
-            self._update_preview()
-        elif skipped:
-            self.status_bar.showMessage(
-                "Dropped files were already listed or not PDFs.",
-                4000,
-            )
+    def _on_files_indexed(self, requested: List[str], indexed: List[str]) -> None:
+        counts = {}
+        for path in indexed:
+            metadata = self.pdf_index.peek(path)
+            if metadata is not None:
+                counts[path] = metadata.page_count
+        self.file_model.set_page_counts(counts)
+        self.file_model.mark_unreadable([path for path in requested if path not in counts])
 
     def _remove_selected_files(self) -> None:
-        rows = sorted({index.row() for index in self.file_list.selectedIndexes()}, reverse=True)
+        rows = self.file_list.selected_rows()
         if not rows:
             self.status_bar.showMessage("Select files to remove.", 3000)
             return
-        for row in rows:
-            item = self.file_list.takeItem(row)
-            if item:
-                path = item.data(Qt.ItemDataRole.UserRole)
-                self.page_by_file.pop(str(path), None)
+        for path in self.file_model.remove_rows(rows):
+            self.page_by_file.pop(path, None)
+            self.pdf_index.discard(path)
+            self.preview_cache.discard_file(path)
+            self.thumbnail_panel.cancel(path)
         self.status_bar.showMessage(f"Removed {len(rows)} file(s)", 4000)
         self._update_preview()
 
     def _clear_files(self) -> None:
-        if self.file_list.count() == 0:
+        if self.file_model.rowCount() == 0:
             return
         confirm = QMessageBox.question(
             self,
@@ -453,8 +627,12 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.No,
         )
         if confirm == QMessageBox.StandardButton.Yes:
-            self.file_list.clear()
+            self._stop_ingestion()
+            self.file_model.clear()
             self.page_by_file.clear()
+            self.pdf_index.clear()
+            self.preview_cache.clear()
+            self.thumbnail_panel.cancel_all()
             self.current_pdf_path = None
             self.current_page = 0
             self.total_pages = 0
@@ -462,35 +640,26 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("File list cleared", 3000)
 
     def _toggle_all_checks(self) -> None:
-        if self.file_list.count() == 0:
+        if self.file_model.rowCount() == 0:
             return
-        all_checked = all(
-            self.file_list.item(i).checkState() == Qt.CheckState.Checked
-            for i in range(self.file_list.count())
-        )
-        new_state = Qt.CheckState.Unchecked if all_checked else Qt.CheckState.Checked
-        self.file_list.blockSignals(True)
-        for i in range(self.file_list.count()):
-            self.file_list.item(i).setCheckState(new_state)
-        self.file_list.blockSignals(False)
+        all_checked = self.file_model.all_checked()
+        self.file_model.set_all_checked(not all_checked)
         action = "Unchecked" if all_checked else "Checked"
         self.status_bar.showMessage(f"{action} all files", 3000)
 
     def _move_selected_up(self) -> None:
-        row = self.file_list.currentRow()
+        row = self.file_list.current_row()
         if row <= 0:
             return
-        item = self.file_list.takeItem(row)
-        self.file_list.insertItem(row - 1, item)
-        self.file_list.setCurrentRow(row - 1)
+        self.file_model.move_rows([row], row - 1)
+        self.file_list.set_current_row(row - 1)
 
     def _move_selected_down(self) -> None:
-        row = self.file_list.currentRow()
-        if row < 0 or row >= self.file_list.count() - 1:
+        row = self.file_list.current_row()
+        if row < 0 or row >= self.file_model.rowCount() - 1:
             return
-        item = self.file_list.takeItem(row)
-        self.file_list.insertItem(row + 1, item)
-        self.file_list.setCurrentRow(row + 1)
+        self.file_model.move_rows([row], row + 2)
+        self.file_list.set_current_row(row + 1)
 
     def _choose_output_directory(self) -> None:
         selected = QFileDialog.getExistingDirectory(
@@ -507,52 +676,14 @@ class MainWindow(QMainWindow):
         self.output_dir_label.setText(self._format_dir_label(self.output_directory))
         self.last_directory = self.output_directory
 
-    def _contains_file(self, path: str) -> bool:
-        try:
-            target = str(Path(path).resolve())
-        except (OSError, RuntimeError):
-            target = path
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if not item:
-                continue
-            stored = item.data(Qt.ItemDataRole.UserRole)
-            if not stored:
-                continue
-            try:
-                stored_path = str(Path(str(stored)).resolve())
-            except (OSError, RuntimeError):
-                stored_path = str(stored)
-            if stored_path == target:
-                return True
-        return False
     def _checked_paths(self) -> List[str]:
-        paths: List[str] = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                path = item.data(Qt.ItemDataRole.UserRole)
-                if path:
-                    paths.append(str(path))
-        return paths
+        return self.file_model.checked_paths()
 
     def _all_paths(self) -> List[str]:
-        paths: List[str] = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if item:
-                path = item.data(Qt.ItemDataRole.UserRole)
-                if path:
-                    paths.append(str(path))
-        return paths
+        return self.file_model.paths()
 
     def _current_item_path(self) -> str | None:
-        item = self.file_list.currentItem()
-        if item:
-            path = item.data(Qt.ItemDataRole.UserRole)
-            if path:
-                return str(path)
-        return None
+        return self.file_model.path(self.file_list.current_row())
 
     def _ensure_output_directory(self) -> bool:
         if self.output_directory:
@@ -581,12 +712,12 @@ class MainWindow(QMainWindow):
             self._update_preview(clear=True)
 
     def _on_selection_changed(self) -> None:
-        count = len(self.file_list.selectedIndexes())
+        count = len(self.file_list.selected_rows())
         self.status_bar.showMessage(f"{count} item(s) selected", 3000)
 
-    def _on_item_changed(self, item: QListWidgetItem) -> None:
-        state = "Checked" if item.checkState() == Qt.CheckState.Checked else "Unchecked"
-        name = item.text()
+    def _on_item_changed(self, row: int) -> None:
+        state = "Checked" if self.file_model.is_checked(row) else "Unchecked"
+        name = self.file_model.name(row)
         self.status_bar.showMessage(f"{state} {name}", 3000)
 
     def _on_rows_moved(self, *_args) -> None:
@@ -594,7 +725,12 @@ class MainWindow(QMainWindow):
 
     # ------------------------------------------------------------------ preview
     def _update_preview(self, clear: bool = False) -> None:
+        # Every request bumps the generation so renders still in flight for an
+        # older page or file are recognised as stale and dropped.
+        self._preview_generation += 1
         if clear or not self.current_pdf_path:
+            self._pending_preview = None
+            self.thumbnail_panel.set_document(None)
             self.preview_label.clear()
             self.preview_label.setText("Add a PDF to begin")
             self.total_pages_label.setText("/ 0")
@@ -602,25 +738,124 @@ class MainWindow(QMainWindow):
             return
 
         target_size = self.preview_area.viewport().size()
+        if self._show_cached_preview(target_size):
+            return
+
+        self.page_input.setText(str(self.current_page + 1))
+        self._pending_preview = (
+            self._preview_generation,
+            self.current_pdf_path,
+            self.current_page,
+            target_size,
+        )
+        if not self._preview_busy:
+            self._start_preview_render()
+
+    def _show_cached_preview(self, target_size: QSize) -> bool:
+        metadata = self.pdf_index.peek(self.current_pdf_path)
+        if metadata is None or metadata.encrypted or metadata.page_count == 0:
+            return False
+        page = max(0, min(self.current_page, metadata.page_count - 1))
         try:
-            pixmap, total = render_pdf_page(
+            key = self.preview_cache.make_key(
                 self.current_pdf_path,
-                page_index=self.current_page,
-                target_size=target_size,
+                page,
+                target_size,
+                device_pixel_ratio=self._preview_pixel_ratio(),
             )
-        except PreviewError as exc:
-            self.preview_label.clear()
-            self.preview_label.setText(str(exc))
-            self.total_pages = 0
-            self.total_pages_label.setText("/ 0")
+        except PreviewError:
+            return False
+        cached = self.preview_cache.get(key)
+        if cached is None:
+            return False
+        self._display_preview(self.current_pdf_path, page, metadata.page_count, cached, target_size)
+        return True
+
+    def _start_preview_render(self) -> None:
+        request, self._pending_preview = self._pending_preview, None
+        if request is None:
             return
+        generation, path, page, target_size = request
+        self._preview_busy = True
 
+        worker = Worker(self._render_preview, path, page, target_size, self._preview_pixel_ratio())
+        worker.signals.result.connect(
+            lambda result: self._on_preview_rendered(generation, target_size, result)
+        )
+        worker.signals.error.connect(lambda message: self._on_preview_failed(generation, message))
+        worker.signals.finished.connect(self._on_preview_finished)
+        self.thread_pool.start(worker)
+
+    def _render_preview(self, path: str, page: int, target_size: QSize, pixel_ratio: float) -> tuple:
+        """Resolve metadata and render the page; runs on a worker thread."""
+        metadata = self.pdf_index.get(path)
+        if metadata.encrypted:
+            raise PreviewError("Password-protected PDFs cannot be previewed")
+        if metadata.page_count == 0:
+            raise PreviewError("Selected PDF has no pages")
+        page = max(0, min(page, metadata.page_count - 1))
+        image = self.preview_cache.render(
+            path,
+            page_index=page,
+            target_size=target_size,
+            device_pixel_ratio=pixel_ratio,
+            digest=metadata.digest,
+        )
+        return path, page, metadata.page_count, image
+
+    def _on_preview_rendered(self, generation: int, target_size: QSize, result: tuple) -> None:
+        if generation != self._preview_generation:
+            return
+        path, page, total, image = result
+        self._display_preview(path, page, total, image, target_size)
+
+    def _on_preview_failed(self, generation: int, message: str) -> None:
+        if generation == self._preview_generation:
+            self._show_preview_message(message)
+
+    def _on_preview_finished(self) -> None:
+        self._preview_busy = False
+        self._start_preview_render()
+
+    def _display_preview(self, path: str, page: int, total: int, image: QImage,
+                         target_size: QSize) -> None:
+        self.current_page = page
         self.total_pages = total
-        self.page_by_file[self.current_pdf_path] = self.current_page
+        self.page_by_file[path] = page
         self.total_pages_label.setText(f"/ {self.total_pages}")
         self.page_input.setText(str(self.current_page + 1))
-        self.preview_label.setPixmap(pixmap)
+        self.preview_label.setPixmap(QPixmap.fromImage(image))
         self.preview_label.setText("")
+        self.thumbnail_panel.set_document(self.pdf_index.peek(path))
+        self.thumbnail_panel.set_current_page(page)
+        self._prefetch_neighbours(target_size)
+
+    def _prefetch_neighbours(self, target_size: QSize) -> None:
+        neighbours = [
+            page
+            for page in (self.current_page + 1, self.current_page - 1)
+            if 0 <= page < self.total_pages
+        ]
+        metadata = self.pdf_index.peek(self.current_pdf_path)
+        if neighbours:
+            worker = Worker(
+                self.preview_cache.prefetch,
+                self.current_pdf_path,
+                neighbours,
+                target_size,
+                device_pixel_ratio=self._preview_pixel_ratio(),
+                digest=metadata.digest if metadata else None,
+            )
+            self.thread_pool.start(worker)
+
+    def _preview_pixel_ratio(self) -> float:
+        return self.preview_area.viewport().devicePixelRatioF()
+
+    def _show_preview_message(self, message: str) -> None:
+        self.preview_label.clear()
+        self.preview_label.setText(message)
+        self.total_pages = 0
+        self.total_pages_label.setText("/ 0")
 
     def _jump_to_page(self) -> None:
         if not self.total_pages:
@@ -636,6 +871,11 @@ class MainWindow(QMainWindow):
         self.current_page = page
         self._update_preview()
 
+    def _show_page(self, page: int) -> None:
+        if 0 <= page < self.total_pages and page != self.current_page:
+            self.current_page = page
+            self._update_preview()
+
     def _show_previous_page(self) -> None:
         if self.current_page > 0:
             self.current_page -= 1
@@ -653,23 +893,32 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Select a PDF to extract from.", 4000)
             return
         try:
-            pages = pdf_ops.parse_page_ranges(self.pages_input.text())
+            page_sets = [
+                pdf_ops.parse_page_ranges(spec)
+                for spec in self.pages_input.text().split(";")
+                if spec.strip()
+            ]
         except pdf_ops.PdfOperationError as exc:
             self.status_bar.showMessage(str(exc), 5000)
             return
-        if not pages:
+        if not page_sets or not all(page_sets):
             self.status_bar.showMessage("Enter at least one page.", 4000)
             return
         if not self._ensure_output_directory():
             return
 
-        def work() -> str:
-            return pdf_ops.extract_pages(target, pages, self.output_directory)
+        output_directory = self.output_directory
 
-        def on_success(result: str) -> None:
-            self.status_bar.showMessage(f"Extracted pages to {Path(result).name}", 6000)
+        def work(**job) -> List[str]:
+            return pdf_ops.extract_page_sets(target, page_sets, output_directory, **job)
+
+        def on_success(result: List[str]) -> None:
+            if len(result) == 1:
+                self.status_bar.showMessage(f"Extracted pages to {Path(result[0]).name}", 6000)
+            else:
+                self.status_bar.showMessage(f"Extracted {len(result)} files to {output_directory}", 6000)
 
-        self._run_background("Extracting pages", work, on_success)
+        self._submit_job(f"Extract pages from {Path(target).name}", work, on_success)
 
     def _merge_checked(self) -> None:
         paths = self._checked_paths()
@@ -681,8 +930,18 @@ class MainWindow(QMainWindow):
         if not self._ensure_output_directory():
             return
 
-        def work() -> str:
-            return pdf_ops.merge_pdfs(paths, self.output_directory, prefix="merged_selection")
+        output_directory = self.output_directory
+        deduplicate = self.merge_dedupe_check.isChecked()
+
+        def work(**job) -> str:
+            page_counts = []
+            for path in paths:
+                metadata = self.pdf_index.get(path)
+                if metadata.encrypted:
+                    raise pdf_ops.PdfOperationError(f"{Path(path).name} is password protected")
+                page_counts.append(metadata.page_count)
+            return pdf_ops.merge_pdfs(paths, output_directory, prefix="merged_selection",
+                                      deduplicate=deduplicate, page_counts=page_counts, **job)
 
         def on_success(result: str) -> None:
             self.status_bar.showMessage(
@@ -690,18 +949,53 @@ class MainWindow(QMainWindow):
                 6000,
             )
 
-        self._run_background("Merging PDFs", work, on_success)
+        self._submit_job(f"Merge {len(paths)} PDFs", work, on_success)
+
+    def _on_split_mode_changed(self) -> None:
+        mode = self.split_mode_combo.currentData()
+        placeholders = {
+            "chunks": "Pages per file (e.g. 50)",
+            "ranges": "One file per range, separated by ; (e.g. 1-10; 11-20,25)",
+        }
+        self.split_value_input.setEnabled(mode in placeholders)
+        self.split_value_input.setPlaceholderText(placeholders.get(mode, ""))
 
     def _split_current(self) -> None:
         target = self._current_item_path() or (self._checked_paths()[:1][0] if self._checked_paths() else None)
         if not target:
             self.status_bar.showMessage("Select a PDF to split.", 4000)
             return
+        mode = self.split_mode_combo.currentData()
+        value = self.split_value_input.text().strip()
+        chunk_size = 1
+        ranges: List[str] = []
+        if mode == "chunks":
+            try:
+                chunk_size = int(value)
+            except ValueError:
+                self.status_bar.showMessage("Enter how many pages each file should hold.", 5000)
+                return
+        elif mode == "ranges":
+            ranges = [spec for spec in value.split(";") if spec.strip()]
+            if not ranges:
+                self.status_bar.showMessage("Enter at least one page range.", 4000)
+                return
         if not self._ensure_output_directory():
             return
 
-        def work() -> str:
-            return pdf_ops.split_pdf(target, self.output_directory)
+        output_directory = self.output_directory
+        workers = self.split_workers
+
+        def work(**job) -> str:
+            return pdf_ops.split_pdf(
+                target,
+                output_directory,
+                workers=workers,
+                mode=mode,
+                chunk_size=chunk_size,
+                ranges=ranges,
+                **job,
+            )
 
         def on_success(result: str) -> None:
             folder = Path(result)
@@ -710,7 +1004,7 @@ class MainWindow(QMainWindow):
                 6000,
             )
 
-        self._run_background("Splitting PDF", work, on_success)
+        self._submit_job(f"Split {Path(target).name}", work, on_success)
 
     def _rotate_current(self) -> None:
         target = self._current_item_path() or (self._checked_paths()[:1][0] if self._checked_paths() else None)
@@ -722,36 +1016,97 @@ class MainWindow(QMainWindow):
         except ValueError:
             self.status_bar.showMessage("Enter a rotation value (e.g. 90).", 5000)
             return
+        try:
+            pages = pdf_ops.parse_page_ranges(self.rotate_pages_input.text()) or None
+        except pdf_ops.PdfOperationError as exc:
+            self.status_bar.showMessage(str(exc), 5000)
+            return
         if not self._ensure_output_directory():
             return
 
-        def work() -> str:
-            return pdf_ops.rotate_pdf(target, self.output_directory, rotation)
+        output_directory = self.output_directory
+
+        def work(**job) -> str:
+            return pdf_ops.rotate_pdf(target, output_directory, rotation, pages=pages, **job)
 
         def on_success(result: str) -> None:
             self.status_bar.showMessage(f"Rotated PDF saved as {Path(result).name}", 6000)
 
-        self._run_background("Rotating PDF", work, on_success)
+        self._submit_job(f"Rotate {Path(target).name}", work, on_success)
 
-    def _compress_current(self) -> None:
-        target = self._current_item_path() or (self._checked_paths()[:1][0] if self._checked_paths() else None)
-        if not target:
-            self.status_bar.showMessage("Select a PDF to compress.", 4000)
+    def _on_compress_profile_changed(self) -> None:
+        self.compress_target_spin.setEnabled(self.compress_profile_combo.currentData() == "target")
+
+    def _compress_checked(self) -> None:
+        targets = self._checked_paths()
+        if not targets and self._current_item_path():
+            targets = [self._current_item_path()]
+        if not targets:
+            self.status_bar.showMessage("Check or select PDFs to compress.", 4000)
             return
         if not self._ensure_output_directory():
             return
 
-        def work() -> tuple[str, float]:
-            return pdf_ops.compress_pdf(target, self.output_directory)
-
-        def on_success(result: tuple[str, float]) -> None:
-            output_path, ratio = result
-            self.status_bar.showMessage(
-                f"Compressed to {Path(output_path).name} (saved {ratio:.1f}%).",
-                6000,
+        output_directory = self.output_directory
+        profile = self.compress_profile_combo.currentData()
+        target_size = None
+        if profile == "target":
+            profile, target_size = "lossless", self.compress_target_spin.value() * 1024 * 1024
+        workers = self.compress_workers
+
+        def work(**job) -> List[tuple[str, float]]:
+            return pdf_ops.compress_pdfs(
+                targets,
+                output_directory,
+                profile=profile,
+                target_size=target_size,
+                workers=workers,
+                **job,
             )
 
-        self._run_background("Compressing PDF", work, on_success)
+        def on_success(results: List[tuple[str, float]]) -> None:
+            if len(results) == 1:
+                output_path, ratio = results[0]
+                message = f"Compressed to {Path(output_path).name} (saved {ratio:.1f}%)."
+            else:
+                ratios = [ratio for _, ratio in results]
+                message = (
+                    f"Compressed {len(results)} PDFs "
+                    f"(saved {min(ratios):.1f}% to {max(ratios):.1f}%)."
+                )
+            self.status_bar.showMessage(message, 6000)
+
+        label = Path(targets[0]).name if len(targets) == 1 else f"{len(targets)} PDFs"
+        self._submit_job(f"Compress {label}", work, on_success)
+
+    def _on_convert_format_changed(self) -> None:
+        options = self.CONVERT_OPTION_LABELS.get(self.format_combo.currentText().lower())
+        self.convert_option_combo.blockSignals(True)
+        self.convert_option_combo.clear()
+        if options is not None:
+            attribute, labels = options
+            for label, value in labels:
+                self.convert_option_combo.addItem(label, value)
+            self.convert_option_combo.setCurrentIndex(
+                max(0, self.convert_option_combo.findData(getattr(self, attribute)))
+            )
+        self.convert_option_combo.blockSignals(False)
+        self.convert_option_combo.setVisible(options is not None)
+        self._update_slide_dpi_visibility()
+
+    def _on_convert_option_changed(self) -> None:
+        options = self.CONVERT_OPTION_LABELS.get(self.format_combo.currentText().lower())
+        if options is not None:
+            setattr(self, options[0], self.convert_option_combo.currentData())
+        self._update_slide_dpi_visibility()
+
+    def _on_slide_dpi_changed(self, value: int) -> None:
+        self.slide_dpi = value
+
+    def _update_slide_dpi_visibility(self) -> None:
+        self.slide_dpi_spin.setVisible(
+            self.format_combo.currentText() == "PowerPoint" and self.slide_mode == "image"
+        )
 
     def _convert_current(self) -> None:
         target = self._current_item_path() or (self._checked_paths()[:1][0] if self._checked_paths() else None)
@@ -762,8 +1117,23 @@ class MainWindow(QMainWindow):
             return
         format_choice = self.format_combo.currentText().lower()
 
-        def work() -> str:
-            return pdf_ops.convert_pdf(target, self.output_directory, format_choice)
+        output_directory = self.output_directory
+        workers = self.convert_workers
+        text_backend, table_backend = self.text_backend, self.table_backend
+        slide_mode, slide_dpi = self.slide_mode, self.slide_dpi
+
+        def work(**job) -> str:
+            return pdf_ops.convert_pdf(
+                target,
+                output_directory,
+                format_choice,
+                workers=workers,
+                text_backend=text_backend,
+                slide_mode=slide_mode,
+                dpi=slide_dpi,
+                table_backend=table_backend,
+                **job,
+            )
 
         def on_success(result: str) -> None:
             self.status_bar.showMessage(
@@ -771,32 +1141,19 @@ class MainWindow(QMainWindow):
                 6000,
             )
 
-        self._run_background(f"Converting to {format_choice.title()}", work, on_success)
+        self._submit_job(f"Convert {Path(target).name} to {format_choice.title()}", work, on_success)
 
     # ------------------------------------------------------------------ async helpers
-    def _run_background(self, label: str, function, on_success=None) -> None:
-        progress = QProgressDialog(f"{label}…", None, 0, 0, self)
-        progress.setWindowTitle("PDF Toolkit")
-        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
-        progress.setCancelButton(None)
-        progress.setMinimumDuration(0)
-
-        worker = Worker(function)
-
-        if on_success:
-            worker.signals.result.connect(on_success)
-        worker.signals.error.connect(lambda message: self._show_error(label, message, progress))
-        worker.signals.finished.connect(lambda: self._finish_progress(progress))
-
-        self.status_bar.showMessage(f"{label}…")
-        self.thread_pool.start(worker)
-
-    def _finish_progress(self, dialog: QProgressDialog) -> None:
-        dialog.close()
-        QTimer.singleShot(0, lambda: self.status_bar.showMessage("Ready", 2000))
+    def _submit_job(self, label: str, function, on_success=None) -> None:
+        """Queue ``function(progress=..., cancel_event=...)`` on the job queue."""
+        self.job_queue.submit(
+            label,
+            function,
+            on_success,
+            on_error=lambda message: self._show_error(label, message),
+        )
+        self.status_bar.showMessage(f"Queued: {label}", 3000)
 
-    def _show_error(self, title: str, message: str, dialog: QProgressDialog | None = None) -> None:
-        if dialog is not None:
-            dialog.close()
+    def _show_error(self, title: str, message: str) -> None:
         QMessageBox.critical(self, title, message)
         self.status_bar.showMessage(message, 6000)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import Tuple
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Tuple
 
 import fitz  # PyMuPDF
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtCore import QSize
 from PyQt6.QtGui import QImage, QPixmap
 
-__all__ = ["PreviewError", "render_pdf_page"]
+from pdf_combiner.ui.disk_cache import DiskImageCache
+
+__all__ = [
+    "PreviewCache",
+    "PreviewError",
+    "render_page_image",
+    "render_pdf_image",
+    "render_pdf_page",
+]
 
 
 class PreviewError(Exception):
@@ -14,47 +25,249 @@ class PreviewError(Exception):
 
 
 def _to_qimage(pix: fitz.Pixmap) -> QImage:
+    """Wrap the pixmap's sample buffer in a QImage without copying it.
+
+    The QImage reads straight from MuPDF's memory, so the pixmap is pinned on the
+    returned object and lives exactly as long as the image wrapper does.
+    """
     if pix.alpha:
-        fmt = QImage.Format.Format_RGBA8888
+        fmt = QImage.Format.Format_RGBA8888_Premultiplied
     else:
         fmt = QImage.Format.Format_RGB888
-    image = QImage(pix.samples, pix.width, pix.height, pix.stride, fmt)
-    copied = image.copy()
-    if pix.alpha:
-        copied = copied.convertToFormat(QImage.Format.Format_RGBA8888)
-    return copied
+    image = QImage(pix.samples_ptr, pix.width, pix.height, pix.stride, fmt)
+    image._pixmap = pix
+    return image
 
 
-def render_pdf_page(
+def _fit_matrix(rect: fitz.Rect, target_size: QSize, device_pixel_ratio: float) -> fitz.Matrix:
+    """Return the matrix that renders ``rect`` exactly into ``target_size`` device pixels."""
+    scale = min(target_size.width() / rect.width, target_size.height() / rect.height)
+    scale *= device_pixel_ratio
+    return fitz.Matrix(scale, scale)
+
+
+def render_page_image(
+    page: fitz.Page,
+    target_size: QSize | None = None,
+    zoom: float = 2.0,
+    device_pixel_ratio: float = 1.0,
+    clip: Tuple[float, float, float, float] | None = None,
+) -> QImage:
+    """Rasterise an already opened page; see :func:`render_pdf_image` for the options."""
+    fit = target_size is not None and not target_size.isEmpty()
+    area = fitz.Rect(clip) if clip else page.rect
+    if area.is_empty:
+        raise PreviewError("Preview area is empty")
+    if fit:
+        matrix = _fit_matrix(area, target_size, device_pixel_ratio)
+    else:
+        matrix = fitz.Matrix(zoom, zoom)
+    image = _to_qimage(page.get_pixmap(matrix=matrix, clip=area if clip else None))
+    if fit:
+        image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+
+def render_pdf_image(
     pdf_path: str,
     page_index: int = 0,
     target_size: QSize | None = None,
     zoom: float = 2.0,
-) -> Tuple[QPixmap, int]:
-    """Render a PDF page into a QPixmap and return it with the total page count."""
+    device_pixel_ratio: float = 1.0,
+    clip: Tuple[float, float, float, float] | None = None,
+) -> Tuple[QImage, int]:
+    """Render a PDF page into a QImage and return it with the total page count.
+
+    With a ``target_size`` the page (or the ``clip`` rectangle, in page
+    coordinates) is rasterised straight at the resolution that fits the target
+    in device pixels, instead of rendering at ``zoom`` and scaling down. Unlike
+    :func:`render_pdf_page` this only touches ``QImage`` and is safe to call from
+    worker threads.
+    """
     try:
         with fitz.open(pdf_path) as document:
             if document.page_count == 0:
                 raise PreviewError("Selected PDF has no pages")
 
             clamped_index = max(0, min(page_index, document.page_count - 1))
-            page = document[clamped_index]
-            matrix = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=matrix)
+            image = render_page_image(
+                document[clamped_index], target_size, zoom, device_pixel_ratio, clip
+            )
             page_count = document.page_count
     except PreviewError:
         raise
     except Exception as exc:
         raise PreviewError(f"Unable to render PDF preview: {exc}") from exc
 
-    image = _to_qimage(pix)
-    qt_pixmap = QPixmap.fromImage(image)
+    return image, page_count
+
+
+def _render_options(
+    page_index: int,
+    target_size: QSize | None,
+    zoom: float,
+    device_pixel_ratio: float,
+    clip: Tuple[float, float, float, float] | None,
+) -> tuple:
+    width, height = (target_size.width(), target_size.height()) if target_size else (0, 0)
+    return (page_index, zoom, width, height, device_pixel_ratio, tuple(clip) if clip else None)
+
+
+def render_pdf_page(
+    pdf_path: str,
+    page_index: int = 0,
+    target_size: QSize | None = None,
+    zoom: float = 2.0,
+    device_pixel_ratio: float = 1.0,
+    clip: Tuple[float, float, float, float] | None = None,
+) -> Tuple[QPixmap, int]:
+    """Render a PDF page into a QPixmap and return it with the total page count."""
+    image, page_count = render_pdf_image(
+        pdf_path, page_index, target_size, zoom, device_pixel_ratio, clip
+    )
+    return QPixmap.fromImage(image), page_count
+
+
+class PreviewCache:
+    """Thread-safe LRU cache of rendered preview images, capped by total bytes.
 
-    if target_size and not target_size.isEmpty():
-        qt_pixmap = qt_pixmap.scaled(
-            target_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+    Entries are keyed by path, mtime, size and every render option, so edits to a
+    file on disk never serve a stale frame. With a ``disk_cache`` and the file's
+    content ``digest`` misses fall back to images persisted by earlier sessions
+    before anything is rendered.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024,
+                 disk_cache: DiskImageCache | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self._entries: OrderedDict[tuple, QImage] = OrderedDict()
+        self._bytes = 0
+        self._pending: set[tuple] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        pdf_path: str,
+        page_index: int,
+        target_size: QSize | None,
+        zoom: float = 2.0,
+        device_pixel_ratio: float = 1.0,
+        clip: Tuple[float, float, float, float] | None = None,
+    ) -> tuple:
+        try:
+            stat = os.stat(pdf_path)
+        except OSError as exc:
+            raise PreviewError(f"Unable to render PDF preview: {exc}") from exc
+        return (pdf_path, stat.st_mtime_ns, stat.st_size) + _render_options(
+            page_index, target_size, zoom, device_pixel_ratio, clip
         )
 
-    return qt_pixmap, page_count
+    def get(self, key: tuple) -> QImage | None:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key: tuple, image: QImage) -> None:
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.sizeInBytes()
+            self._entries[key] = image
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.sizeInBytes()
+
+    def render(
+        self,
+        pdf_path: str,
+        page_index: int = 0,
+        target_size: QSize | None = None,
+        zoom: float = 2.0,
+        device_pixel_ratio: float = 1.0,
+        clip: Tuple[float, float, float, float] | None = None,
+        digest: str | None = None,
+    ) -> QImage:
+        """Return the cached frame for the page, rendering and caching it on a miss."""
+        key = self.make_key(pdf_path, page_index, target_size, zoom, device_pixel_ratio, clip)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        options = _render_options(page_index, target_size, zoom, device_pixel_ratio, clip)
+        image = self._load_from_disk(digest, options, device_pixel_ratio)
+        if image is None:
+            image, _ = render_pdf_image(
+                pdf_path, page_index, target_size, zoom, device_pixel_ratio, clip
+            )
+            self._save_to_disk(digest, options, image)
+        self.put(key, image)
+        return image
+
+    def prefetch(
+        self,
+        pdf_path: str,
+        page_indices: Iterable[int],
+        target_size: QSize | None = None,
+        zoom: float = 2.0,
+        device_pixel_ratio: float = 1.0,
+        digest: str | None = None,
+    ) -> None:
+        """Render the given pages into the cache, skipping ones cached or in flight."""
+        for page_index in page_indices:
+            try:
+                key = self.make_key(pdf_path, page_index, target_size, zoom, device_pixel_ratio)
+            except PreviewError:
+                return
+            with self._lock:
+                if key in self._entries or key in self._pending:
+                    continue
+                self._pending.add(key)
+            try:
+                self.render(
+                    pdf_path,
+                    page_index,
+                    target_size,
+                    zoom,
+                    device_pixel_ratio,
+                    digest=digest,
+                )
+            except PreviewError:
+                pass
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+    def _load_from_disk(self, digest: str | None, options: tuple,
+                        device_pixel_ratio: float) -> QImage | None:
+        if self.disk_cache is None or digest is None:
+            return None
+        image = self.disk_cache.get(("preview", digest) + options)
+        if image is not None:
+            image.setDevicePixelRatio(device_pixel_ratio)
+        return image
+
+    def _save_to_disk(self, digest: str | None, options: tuple, image: QImage) -> None:
+        if self.disk_cache is not None and digest is not None:
+            # Encoding a PNG costs several times the render itself, so it happens
+            # off the render path; options[0] is the page, so only the latest
+            # size of each page waits to be written.
+            self.disk_cache.put_later(
+                ("preview", digest) + options, image, slot=("preview", digest, options[0])
+            )
+
+    def discard_file(self, pdf_path: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == pdf_path]:
+                image = self._entries.pop(key)
+                self._bytes -= image.sizeInBytes()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
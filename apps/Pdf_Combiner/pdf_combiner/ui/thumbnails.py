@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import threading
+import traceback
+from collections import deque
+from typing import Any, Iterable, List
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QImage, QPixmap
+from PyQt6.QtWidgets import QAbstractItemView, QListView
+
+from pdf_combiner.services.pdf_index import PdfMetadata
+from pdf_combiner.ui.disk_cache import DiskImageCache
+from pdf_combiner.ui.preview import render_page_image
+
+__all__ = ["ThumbnailPanel", "ThumbnailRenderer"]
+
+THUMBNAIL_SIZE = QSize(96, 128)
+# Pages rendered ahead of and behind the visible ones, and the wider window of
+# pixmaps kept in memory; the rest come back from the disk cache on scroll.
+_PREFETCH_PAGES = 30
+_RETAIN_PAGES = 90
+
+
+class _ThumbnailJob(QRunnable):
+    def __init__(self, renderer: ThumbnailRenderer) -> None:
+        super().__init__()
+        self.renderer = renderer
+
+    def run(self) -> None:  # pragma: no cover - executed on background threads
+        self.renderer._drain()
+
+
+class ThumbnailRenderer(QObject):
+    """Renders low-resolution page thumbnails on the thread pool in request order.
+
+    Each :meth:`request` replaces the queue for a document, so the caller can
+    re-prioritise (visible pages first) whenever the view scrolls. Cancelled
+    documents are dropped from the queue and any result still in flight for them
+    is discarded.
+    """
+
+    # The image travels as a Python object so the pixmap pinned on it by
+    # ``render_page_image`` stays alive until the UI thread converts it.
+    thumbnailReady = pyqtSignal(str, int, object)
+
+    def __init__(self, disk_cache: DiskImageCache | None = None,
+                 thread_pool: QThreadPool | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.disk_cache = disk_cache or DiskImageCache()
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.device_pixel_ratio = 1.0
+        self._queue: deque[tuple[str, int]] = deque()
+        self._digests: dict[str, str] = {}
+        self._generations: dict[str, int] = {}
+        self._running = False
+        self._lock = threading.Lock()
+
+    def request(self, pdf_path: str, digest: str, page_indices: Iterable[int]) -> None:
+        with self._lock:
+            self._digests[pdf_path] = digest
+            self._generations.setdefault(pdf_path, 0)
+            self._queue = deque((pdf_path, page) for page in page_indices)
+            if self._running or not self._queue:
+                return
+            self._running = True
+        self.thread_pool.start(_ThumbnailJob(self))
+
+    def cancel(self, pdf_path: str) -> None:
+        with self._lock:
+            self._queue = deque(entry for entry in self._queue if entry[0] != pdf_path)
+            self._generations[pdf_path] = self._generations.get(pdf_path, 0) + 1
+            self._digests.pop(pdf_path, None)
+
+    def cancel_all(self) -> None:
+        with self._lock:
+            for pdf_path in list(self._generations):
+                self._generations[pdf_path] += 1
+            self._queue.clear()
+            self._digests.clear()
+
+    def _pixel_size(self) -> QSize:
+        return QSize(
+            round(THUMBNAIL_SIZE.width() * self.device_pixel_ratio),
+            round(THUMBNAIL_SIZE.height() * self.device_pixel_ratio),
+        )
+
+    def _drain(self) -> None:
+        document: fitz.Document | None = None
+        open_path: str | None = None
+        try:
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        self._running = False
+                        return
+                    pdf_path, page_index = self._queue.popleft()
+                    digest = self._digests.get(pdf_path)
+                    generation = self._generations.get(pdf_path)
+                if digest is None:
+                    continue
+
+                size = self._pixel_size()
+                cache_key = ("thumbnail", digest, page_index, size.width(), size.height())
+                image = self.disk_cache.get(cache_key)
+                if image is None:
+                    try:
+                        if open_path != pdf_path:
+                            if document is not None:
+                                document.close()
+                                document, open_path = None, None
+                            document = fitz.open(pdf_path)
+                            open_path = pdf_path
+                        image = render_page_image(document[page_index], target_size=size)
+                    except Exception:  # noqa: BLE001 - a bad page must not stop the queue
+                        traceback.print_exc()
+                        continue
+                    self.disk_cache.put(cache_key, image, "JPG", 80)
+                image.setDevicePixelRatio(self.device_pixel_ratio)
+
+                with self._lock:
+                    stale = generation != self._generations.get(pdf_path)
+                if not stale:
+                    self.thumbnailReady.emit(pdf_path, page_index, image)
+        except Exception:  # noqa: BLE001 - keep the renderer usable after failures
+            traceback.print_exc()
+            with self._lock:
+                self._running = False
+        finally:
+            if document is not None:
+                document.close()
+
+
+class _ThumbnailModel(QAbstractListModel):
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.pdf_path: str | None = None
+        self.page_count = 0
+        self.pixmaps: dict[int, QPixmap] = {}
+        self.placeholder = QPixmap(THUMBNAIL_SIZE)
+        self.placeholder.fill(QColor("#1f2940"))
+
+    def reset(self, pdf_path: str | None, page_count: int) -> None:
+        self.beginResetModel()
+        self.pdf_path = pdf_path
+        self.page_count = page_count
+        self.pixmaps.clear()
+        self.endResetModel()
+
+    def retain(self, pages: range) -> None:
+        """Drop the pixmaps of pages outside ``pages``; they show the placeholder until re-rendered."""
+        if any(page not in pages for page in self.pixmaps):
+            self.pixmaps = {page: pixmap for page, pixmap in self.pixmaps.items() if page in pages}
+
+    def set_thumbnail(self, page_index: int, image: QImage) -> None:
+        if 0 <= page_index < self.page_count:
+            self.pixmaps[page_index] = QPixmap.fromImage(image)
+            index = self.index(page_index)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008 - Qt signature
+        return 0 if parent.isValid() else self.page_count
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(index.row() + 1)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.pixmaps.get(index.row(), self.placeholder)
+        return None
+
+
+class ThumbnailPanel(QListView):
+    """Horizontal, virtualised strip of page thumbnails for the current PDF."""
+
+    pageActivated = pyqtSignal(int)
+
+    def __init__(self, renderer: ThumbnailRenderer | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self.renderer = renderer or ThumbnailRenderer(parent=self)
+        self.renderer.thumbnailReady.connect(self._on_thumbnail_ready)
+        self.thumbnail_model = _ThumbnailModel(self)
+        self.setModel(self.thumbnail_model)
+        self.digest: str | None = None
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setMovement(QListView.Movement.Static)
+        self.setIconSize(THUMBNAIL_SIZE)
+        self.setSpacing(6)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setFixedHeight(THUMBNAIL_SIZE.height() + 48)
+
+        self._schedule_timer = QTimer(self)
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.setInterval(40)
+        self._schedule_timer.timeout.connect(self._request_thumbnails)
+        self.horizontalScrollBar().valueChanged.connect(lambda *_: self._schedule_timer.start())
+        self.clicked.connect(lambda index: self.pageActivated.emit(index.row()))
+
+    @property
+    def pdf_path(self) -> str | None:
+        return self.thumbnail_model.pdf_path
+
+    def set_document(self, metadata: PdfMetadata | None) -> None:
+        if metadata is None:
+            if self.pdf_path:
+                self.renderer.cancel(self.pdf_path)
+            self.digest = None
+            self.thumbnail_model.reset(None, 0)
+            return
+        if metadata.path == self.pdf_path and metadata.digest == self.digest:
+            return
+        if self.pdf_path:
+            self.renderer.cancel(self.pdf_path)
+        self.digest = metadata.digest
+        self.thumbnail_model.reset(metadata.path, metadata.page_count)
+        self.renderer.device_pixel_ratio = self.devicePixelRatioF()
+        self._schedule_timer.start()
+
+    def set_current_page(self, page_index: int) -> None:
+        if 0 <= page_index < self.thumbnail_model.page_count:
+            index = self.thumbnail_model.index(page_index)
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
+
+    def cancel(self, pdf_path: str) -> None:
+        self.renderer.cancel(pdf_path)
+        if pdf_path == self.pdf_path:
+            self.set_document(None)
+
+    def cancel_all(self) -> None:
+        self.renderer.cancel_all()
+        self.set_document(None)
+
+    def resizeEvent(self, event):  # noqa: D401 - Qt override
+        super().resizeEvent(event)
+        self._schedule_timer.start()
+
+    def _visible_rows(self) -> range:
+        count = self.thumbnail_model.page_count
+        if not count:
+            return range(0)
+        viewport = self.viewport().rect()
+        first = self.indexAt(QPoint(viewport.left() + 4, viewport.center().y()))
+        last = self.indexAt(QPoint(viewport.right() - 4, viewport.center().y()))
+        start = first.row() if first.isValid() else 0
+        stop = last.row() if last.isValid() else min(count - 1, start + 16)
+        return range(start, stop + 1)
+
+    def _request_thumbnails(self) -> None:
+        if not self.pdf_path or not self.digest:
+            return
+        visible = self._visible_rows()
+        count = self.thumbnail_model.page_count
+        order: List[int] = list(visible)
+        order.extend(range(visible.stop, min(count, visible.stop + _PREFETCH_PAGES)))
+        order.extend(range(visible.start - 1, max(-1, visible.start - 1 - _PREFETCH_PAGES), -1))
+        self.thumbnail_model.retain(
+            range(max(0, visible.start - _RETAIN_PAGES), visible.stop + _RETAIN_PAGES)
+        )
+        missing = [page for page in order if page not in self.thumbnail_model.pixmaps]
+        self.renderer.request(self.pdf_path, self.digest, missing)
+
+    def _on_thumbnail_ready(self, pdf_path: str, page_index: int, image: QImage) -> None:
+        if pdf_path == self.pdf_path:
+            self.thumbnail_model.set_thumbnail(page_index, image)
@@ -1,51 +1,317 @@
 from __future__ import annotations
 
-from typing import Iterable
+from array import array
+from typing import Any, Hashable, Iterable, List, Sequence
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QListWidget
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QAbstractItemView, QListView
 
+_UNREADABLE = -2
 
-class FileListWidget(QListWidget):
-    """QListWidget that accepts PDF files dropped from the OS."""
+
+class FileListModel(QAbstractListModel):
+    """List model for the PDF queue, stored as compact parallel arrays.
+
+    Each row holds a path, a checked flag, a page count (``-1`` until indexed,
+    ``-2`` once indexing found the file unreadable) and a size in bytes. Rows
+    are also indexed by path and by file identity, so duplicate checks and path
+    lookups never scan the list. Unreadable rows are unchecked, and checking
+    every row leaves them out.
+    """
+
+    checkStateToggled = pyqtSignal(int)
+    orderChanged = pyqtSignal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._names: List[str] = []
+        self._identities: List[Hashable] = []
+        self._checked = bytearray()
+        self._page_counts = array("q")
+        self._sizes = array("q")
+        self._known_paths: set[str] = set()
+        self._known_identities: set[Hashable] = set()
+
+    # ------------------------------------------------------------------ Qt API
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008 - Qt signature
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[row]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            return self._paths[row]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            pages = self._page_counts[row]
+            details = f"{self._sizes[row] / (1024 * 1024):.1f} MB"
+            if pages >= 0:
+                details = f"{pages} pages, {details}"
+            elif pages == _UNREADABLE:
+                details = f"Not a readable PDF, {details}"
+            return f"{self._paths[row]}\n{details}"
+        if role == Qt.ItemDataRole.ForegroundRole and self._page_counts[row] == _UNREADABLE:
+            return QColor("#e57373")
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        state = Qt.CheckState(value) if isinstance(value, int) else value
+        self._checked[index.row()] = state == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checkStateToggled.emit(index.row())
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsUserCheckable
+            | Qt.ItemFlag.ItemIsDragEnabled
+        )
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    # ------------------------------------------------------------------ queue API
+    def contains(self, path: str, identity: Hashable) -> bool:
+        return path in self._known_paths or identity in self._known_identities
+
+    def append_files(self, files: Iterable[tuple[str, str, Hashable, int]]) -> List[str]:
+        """Append ``(path, name, identity, size)`` entries in one batch, skipping duplicates.
+
+        Returns the paths that were actually appended.
+        """
+        batch = []
+        for path, name, identity, size in files:
+            if self.contains(path, identity):
+                continue
+            self._known_paths.add(path)
+            self._known_identities.add(identity)
+            batch.append((path, name, identity, size))
+        if not batch:
+            return []
+
+        start = len(self._paths)
+        self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+        for path, name, identity, size in batch:
+            self._paths.append(path)
+            self._names.append(name)
+            self._identities.append(identity)
+            self._sizes.append(size)
+        self._checked.extend(b"\x01" * len(batch))
+        self._page_counts.extend([-1] * len(batch))
+        self.endInsertRows()
+        return [entry[0] for entry in batch]
+
+    def remove_rows(self, rows: Iterable[int]) -> List[str]:
+        """Remove the given rows and return their paths."""
+        removed: List[str] = []
+        for first, last in _descending_runs(rows):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self._paths[first:last + 1])
+            for identity in self._identities[first:last + 1]:
+                self._known_identities.discard(identity)
+            self._known_paths.difference_update(self._paths[first:last + 1])
+            for column in self._columns():
+                del column[first:last + 1]
+            self.endRemoveRows()
+        return removed
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        for column in self._columns():
+            del column[:]
+        self._known_paths.clear()
+        self._known_identities.clear()
+        self.endResetModel()
+
+    def move_rows(self, rows: Sequence[int], destination: int) -> List[int]:
+        """Move ``rows`` (kept in order) so they start before ``destination``.
+
+        Returns the new row numbers of the moved entries.
+        """
+        moving = sorted(set(row for row in rows if 0 <= row < len(self._paths)))
+        if not moving:
+            return []
+        moving_set = set(moving)
+        remaining = [row for row in range(len(self._paths)) if row not in moving_set]
+        insert_at = max(0, destination - sum(1 for row in moving if row < destination))
+        insert_at = min(insert_at, len(remaining))
+        order = remaining[:insert_at] + moving + remaining[insert_at:]
+        if order == list(range(len(order))):
+            return moving
+
+        self.layoutAboutToBeChanged.emit()
+        new_row = {old: new for new, old in enumerate(order)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_row[index.row()]) if index.isValid() else index for index in persistent],
+        )
+        self._paths = [self._paths[row] for row in order]
+        self._names = [self._names[row] for row in order]
+        self._identities = [self._identities[row] for row in order]
+        self._checked = bytearray(self._checked[row] for row in order)
+        self._page_counts = array("q", (self._page_counts[row] for row in order))
+        self._sizes = array("q", (self._sizes[row] for row in order))
+        self.layoutChanged.emit()
+        self.orderChanged.emit()
+        return [new_row[row] for row in moving]
+
+    def path(self, row: int) -> str | None:
+        return self._paths[row] if 0 <= row < len(self._paths) else None
+
+    def name(self, row: int) -> str:
+        return self._names[row]
+
+    def is_checked(self, row: int) -> bool:
+        return bool(self._checked[row])
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def checked_paths(self) -> List[str]:
+        return [path for path, checked in zip(self._paths, self._checked) if checked]
+
+    def all_checked(self) -> bool:
+        return all(
+            checked or count == _UNREADABLE
+            for checked, count in zip(self._checked, self._page_counts)
+        )
+
+    def set_all_checked(self, checked: bool) -> None:
+        if not self._paths:
+            return
+        self._checked[:] = bytes(
+            checked and count != _UNREADABLE for count in self._page_counts
+        )
+        self.dataChanged.emit(
+            self.index(0),
+            self.index(len(self._paths) - 1),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+
+    def set_page_counts(self, counts: dict[str, int]) -> None:
+        """Record indexed page counts for the given paths."""
+        if not counts:
+            return
+        rows = [row for row, path in enumerate(self._paths) if path in counts]
+        for row in rows:
+            self._page_counts[row] = counts[self._paths[row]]
+        if rows:
+            self.dataChanged.emit(
+                self.index(rows[0]),
+                self.index(rows[-1]),
+                [Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def mark_unreadable(self, paths: Iterable[str]) -> None:
+        """Flag and uncheck rows whose file could not be opened as a PDF."""
+        unreadable = set(paths)
+        if not unreadable:
+            return
+        rows = [row for row, path in enumerate(self._paths) if path in unreadable]
+        for row in rows:
+            self._checked[row] = 0
+        self.set_page_counts({path: _UNREADABLE for path in unreadable})
+        if rows:
+            self.dataChanged.emit(self.index(rows[0]), self.index(rows[-1]),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def _columns(self) -> tuple:
+        return (self._paths, self._names, self._identities, self._checked, self._page_counts, self._sizes)
+
+
+def _descending_runs(rows: Iterable[int]) -> List[tuple[int, int]]:
+    runs: List[tuple[int, int]] = []
+    for row in sorted(set(rows), reverse=True):
+        if runs and runs[-1][0] == row + 1:
+            runs[-1] = (row, runs[-1][1])
+        else:
+            runs.append((row, row))
+    return runs
+
+
+class FileListView(QListView):
+    """QListView over a FileListModel that accepts PDF files and folders dropped from the OS."""
 
     filesDropped = pyqtSignal(list)
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.setAcceptDrops(True)
+        self.setDragEnabled(True)
+        self.setDropIndicatorShown(True)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(500)
+
+    def current_row(self) -> int:
+        index = self.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def set_current_row(self, row: int) -> None:
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def selected_rows(self) -> List[int]:
+        return sorted({index.row() for index in self.selectionModel().selectedIndexes()})
 
     def dragEnterEvent(self, event):  # noqa: D401 - Qt override
-        if self._event_has_pdf_urls(event.mimeData()):
+        if self._event_has_local_urls(event.mimeData()):
             event.acceptProposedAction()
             return
         super().dragEnterEvent(event)
 
     def dragMoveEvent(self, event):  # noqa: D401 - Qt override
-        if self._event_has_pdf_urls(event.mimeData()):
+        if self._event_has_local_urls(event.mimeData()):
             event.acceptProposedAction()
             return
         super().dragMoveEvent(event)
 
     def dropEvent(self, event):  # noqa: D401 - Qt override
+        if event.source() is self:
+            self._move_selection_to(event)
+            return
         if event.mimeData().hasUrls():
             paths = [
                 url.toLocalFile()
                 for url in event.mimeData().urls()
                 if url.isLocalFile()
             ]
-            pdf_paths = [path for path in paths if path.lower().endswith('.pdf')]
-            if pdf_paths:
+            # Nothing is stat-ed here: folders and non-PDF entries are sorted out
+            # by the receiver's background discovery.
+            if paths:
                 event.acceptProposedAction()
-                self.filesDropped.emit(pdf_paths)
+                self.filesDropped.emit(paths)
                 return
         super().dropEvent(event)
 
+    def _move_selection_to(self, event) -> None:
+        model = self.model()
+        target = self.indexAt(event.position().toPoint())
+        if not target.isValid():
+            destination = model.rowCount()
+        elif self.dropIndicatorPosition() == QAbstractItemView.DropIndicatorPosition.BelowItem:
+            destination = target.row() + 1
+        else:
+            destination = target.row()
+        model.move_rows(self.selected_rows(), destination)
+        # Report a copy so QAbstractItemView does not delete the "moved" source rows.
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+
     @staticmethod
-    def _event_has_pdf_urls(mime_data) -> bool:
+    def _event_has_local_urls(mime_data) -> bool:
         if not mime_data.hasUrls():
             return False
-        for url in mime_data.urls():
-            if url.isLocalFile() and url.toLocalFile().lower().endswith('.pdf'):
-                return True
-        return False
+        return any(url.isLocalFile() for url in mime_data.urls())
@@ -12,6 +12,7 @@ class WorkerSignals(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
     result = pyqtSignal(object)
+    progress = pyqtSignal(object)
 
 
 class Worker(QRunnable):
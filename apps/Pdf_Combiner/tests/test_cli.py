@@ -0,0 +1,45 @@
+"""Manifest loading in :mod:`pdf_combiner.cli`.
+
+Run from ``apps/Pdf_Combiner`` with ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pdf_combiner import cli
+from pdf_combiner.services import pdf_ops
+
+
+class LoadManifestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        self.root = Path(workdir.name)
+
+    def _load(self, *jobs: dict) -> list:
+        manifest = self.root / "jobs.json"
+        manifest.write_text(json.dumps(list(jobs)), encoding="utf-8")
+        return cli.load_manifest(manifest)
+
+    def test_extract_pages_split_into_sets_on_semicolons(self) -> None:
+        [job] = self._load({"operation": "extract", "input": "a.pdf", "output_dir": "out",
+                            "pages": "1-2;4"})
+        self.assertEqual(job["pages"], "1-2;4")
+
+    def test_rotate_rejects_semicolons_when_the_manifest_loads(self) -> None:
+        with self.assertRaisesRegex(pdf_ops.PdfOperationError, "Job 1: Invalid page number"):
+            self._load({"operation": "rotate", "input": "a.pdf", "output_dir": "out",
+                        "pages": "1;2"})
+
+    def test_rotate_accepts_a_page_list(self) -> None:
+        [job] = self._load({"operation": "rotate", "input": "a.pdf", "output_dir": "out",
+                            "pages": [1, "3-4"]})
+        self.assertEqual(pdf_ops.parse_page_ranges(job["pages"]), [1, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()